@@ -54,7 +54,7 @@ def forensic_log(
     def decorator(func: Callable):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             trace_id = os.getenv("SIDE_TRACE_ID", "no-trace")
             user_id = os.getenv("SIDE_USER_ID", "anonymous")
             project_id = os.getenv("SIDE_PROJECT_ID", "unknown")
@@ -79,7 +79,7 @@ def forensic_log(
             
             try:
                 result = await func(*args, **kwargs)
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = int((time.perf_counter() - start_time) * 1000)
                 
                 # Extract tokens if applicable
                 tokens_used = 0
@@ -113,7 +113,7 @@ def forensic_log(
                 return result
                 
             except Exception as e:
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = int((time.perf_counter() - start_time) * 1000)
                 error_details = {
                     "name": type(e).__name__,
                     "message": str(e),
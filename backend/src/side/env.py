@@ -3,13 +3,36 @@ Environment configuration for Side.
 """
 
 import os
+import re
 import logging
 from pathlib import Path
 
 logger = logging.getLogger("side-mcp")
 
+# Set once a .env has been applied; inherited by child processes (e.g. respawned
+# stdio servers), which then skip the filesystem probing entirely.
+ENV_LOADED_FLAG = "SIDE_ENV_LOADED"
+
+# One KEY=value assignment per line; comment lines (leading '#') never match.
+# Surrounding whitespace is trimmed by the pattern, quotes by _parse_env.
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+
+def _parse_env(text: str) -> dict[str, str]:
+    """Parse .env text into a dict (first assignment of a key wins)."""
+    values: dict[str, str] = {}
+    for key, value in _ENV_LINE_RE.findall(text):
+        value = value.strip("'\"")
+        if value:
+            values.setdefault(key, value)
+    return values
+
+
 def load_env_file() -> None:
     """Load environment variables from .env file."""
+    if os.environ.get(ENV_LOADED_FLAG):
+        return
+
     # Check multiple possible locations (in priority order)
     possible_paths = [
         # Project root (side-mcp/.env) - most likely location
@@ -24,17 +47,10 @@ def load_env_file() -> None:
 
     for env_path in possible_paths:
         try:
-            env_path = env_path.expanduser().resolve()
             if env_path.exists():
-                with open(env_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#") and "=" in line:
-                            key, value = line.split("=", 1)
-                            key = key.strip()
-                            value = value.strip().strip("'\"")
-                            if key and value and key not in os.environ:
-                                os.environ[key] = value
+                for key, value in _parse_env(env_path.read_text()).items():
+                    os.environ.setdefault(key, value)
+                os.environ[ENV_LOADED_FLAG] = "1"
                 break  # Use first found .env
         except Exception:
             continue
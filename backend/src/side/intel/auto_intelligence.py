@@ -1,4 +1,7 @@
+import hashlib
 import logging
+import os
+import subprocess
 from pathlib import Path
 from typing import Dict, Any, List
 from side.intel.memory import MemoryManager
@@ -73,41 +76,55 @@ class AutoIntelligence:
         """
         Phased Git Analysis: Extracts 'Historical Wisdom' from commits.
         Uses LLMClient to convert 'Raw Diffs' into 'Strategic Decisions'.
+
+        Results are memoized on disk per (HEAD, since-date): mining is an LLM call
+        per commit, and nothing changes until HEAD moves or the window's start
+        date rolls over.
         """
-        import subprocess
+        import json
+
+        since = self._history_since(months)
+        cache_file = self._history_cache_path(since)
+        if cache_file and cache_file.exists():
+            try:
+                fragments = json.loads(shield.unseal_file(cache_file))
+                logger.info(f"🕰️ [TIME TRAVEL]: Reusing mined history for HEAD ({cache_file.stem})")
+                self._store_history_fragments(fragments)
+                return fragments
+            except Exception as e:
+                logger.debug(f"History cache unreadable, re-mining: {e}")
+
+        fragments = await self._mine_history(months, since)
+        if fragments is None:
+            return []
+        if cache_file and fragments:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cache_file.with_suffix(".tmp")
+                shield.seal_file(tmp, json.dumps(fragments))
+                os.replace(tmp, cache_file)
+            except Exception as e:
+                logger.debug(f"Failed to write history cache: {e}")
+
+        self._store_history_fragments(fragments)
+        return fragments
+
+    async def _mine_history(self, months: int, since: str) -> List[Dict[str, Any]] | None:
+        """Runs the git + LLM mining pass behind historic_feed (None if git log fails)."""
         from side.llm.client import LLMClient
         
         logger.info(f"🕰️ [TIME TRAVEL]: Mining last {months} months of repository soul...")
         
-        # 1. Get High-Entropy Commits (feat, fix, refactor, breaking)
-        cmd = [
-            "git", "log", 
-            f"--since={months} months ago",
-            "--pretty=format:%H|%an|%ad|%s",
-            "--grep=feat\\|fix\\|refactor\\|breaking\\|chore(deps)",
-            "--no-merges",
-            "-n", "50" # Cap for Alpha
-        ]
-        
-        try:
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True)
-            commits = result.stdout.splitlines()
-        except Exception as e:
-            logger.error(f"Git log failed: {e}")
-            return []
+        # 1. Get High-Entropy Commits (feat, fix, refactor, breaking), diffs included
+        commits = await self._git_log_with_diffs(since)
+        if commits is None:
+            return None
 
         llm = LLMClient(purpose="intelligence")
         fragments = []
         
-        for line in commits:
+        for h, author, date, msg, diff_content in commits:
             try:
-                h, author, date, msg = line.split("|", 3)
-                
-                # Get the diff for this commit
-                diff_cmd = ["git", "show", "--pretty=format:", h]
-                diff_res = subprocess.run(diff_cmd, cwd=self.project_path, capture_output=True, text=True)
-                diff_content = diff_res.stdout[:4000] # Cap diff size for context efficiency
-                
                 # 2. Extract 'The Why' using LLM
                 prompt = [
                     {"role": "user", "content": f"Commit: {msg}\nDiff:\n{diff_content}"}
@@ -127,16 +144,98 @@ class AutoIntelligence:
                 logger.debug(f"Failed to mine commit: {e}")
                 continue
 
-        # 3. Update sovereign.json with fragments
+        return fragments
+
+    def _head_sha(self) -> str | None:
+        """Resolves HEAD from .git directly (one ref: hop), falling back to git rev-parse."""
+        git_dir = self.project_path / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+            if not head.startswith("ref: "):
+                return head
+            ref_file = git_dir / head[5:]
+            if ref_file.exists():
+                return ref_file.read_text().strip()
+        except OSError:
+            pass
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=self.project_path, capture_output=True, timeout=5,
+            )
+            return (result.stdout.strip().decode("ascii", "replace") or None) if result.returncode == 0 else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _history_since(months: int) -> str:
+        """Resolves the start of the mining window, `months` calendar months before today (UTC)."""
+        import calendar
+        from datetime import datetime, timezone
+
+        today = datetime.now(timezone.utc).date()
+        year, month = divmod(today.year * 12 + today.month - 1 - months, 12)
+        day = min(today.day, calendar.monthrange(year, month + 1)[1])
+        return today.replace(year=year, month=month + 1, day=day).isoformat()
+
+    def _history_cache_path(self, since: str) -> Path | None:
+        """Cache location for historic_feed at the current HEAD and window start (None outside git)."""
+        sha = self._head_sha()
+        if not sha:
+            return None
+        key = hashlib.blake2b(f"{sha}:{since}".encode(), digest_size=16).hexdigest()
+        return self.project_path / ".side" / "cache" / f"history_{key}.json"
+
+    def _store_history_fragments(self, fragments: List[Dict[str, Any]]) -> None:
+        """3. Update sovereign.json with fragments."""
+        import json
+
         sovereign_file = self.project_path / ".side" / "sovereign.json"
         if sovereign_file.exists():
-            import json
             raw = shield.unseal_file(sovereign_file)
             data = json.loads(raw)
             data["history_fragments"] = fragments
             shield.seal_file(sovereign_file, json.dumps(data, indent=2))
-            
-        return fragments
+
+    async def _git_log_with_diffs(self, since: str, limit: int = 4000) -> List[tuple] | None:
+        """
+        One `git log -p` walk yielding (hash, author, date, subject, diff) per commit,
+        with each diff capped at `limit` characters. None if git fails.
+        """
+        import asyncio
+
+        # \x01 opens each commit record; header fields are \x1f-separated and the
+        # patch follows the header line
+        cmd = [
+            "git", "log",
+            f"--since={since}",
+            "--pretty=format:%x01%H%x1f%an%x1f%ad%x1f%s",
+            "--grep=feat\\|fix\\|refactor\\|breaking\\|chore(deps)",
+            "--no-merges",
+            "-n", "50", # Cap for Alpha
+            "-p",
+        ]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.project_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            out, _ = await proc.communicate()
+        except Exception as e:
+            logger.error(f"Git log failed: {e}")
+            return None
+
+        commits = []
+        for record in out.decode("utf-8", "replace").split("\x01"):
+            header, _, diff = record.partition("\n")
+            fields = header.split("\x1f")
+            if len(fields) != 4:
+                continue
+            # Cap diff size for context efficiency
+            commits.append((*fields, diff.strip("\n")[:limit]))
+        return commits
 
     async def prune_wisdom(self) -> int:
         """
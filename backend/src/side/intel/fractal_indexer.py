@@ -22,17 +22,20 @@ from side.utils.crypto import shield
 REGEX_PY_CLASS = re.compile(r'^class\s+(\w+)', re.MULTILINE)
 REGEX_PY_DEF = re.compile(r'^def\s+(\w+)', re.MULTILINE)
 
-# Signals to watch for (The 'Shadow Intelligence')
+# Signals to watch for (The 'Shadow Intelligence'): signal name -> token
 SIGNALS = {
-    "FastAPI": re.compile(r'fastapi', re.IGNORECASE),
-    "Stripe": re.compile(r'stripe', re.IGNORECASE),
-    "Supabase": re.compile(r'supabase', re.IGNORECASE),
-    "Alchemy": re.compile(r'alchemy', re.IGNORECASE),
-    "NextJS": re.compile(r'next', re.IGNORECASE),
-    "Tailwind": re.compile(r'tailwind', re.IGNORECASE),
-    "React": re.compile(r'react', re.IGNORECASE),
-    "Zustand": re.compile(r'zustand', re.IGNORECASE),
+    "FastAPI": "fastapi",
+    "Stripe": "stripe",
+    "Supabase": "supabase",
+    "Alchemy": "alchemy",
+    "NextJS": "next",
+    "Tailwind": "tailwind",
+    "React": "react",
+    "Zustand": "zustand",
 }
+# Inverted once: one alternation pass per file instead of one search per signal
+_SIGNAL_BY_TOKEN = {token: name for name, token in SIGNALS.items()}
+REGEX_SIGNALS = re.compile("|".join(map(re.escape, _SIGNAL_BY_TOKEN)), re.IGNORECASE)
 
 from side.services.ignore import SovereignIgnore
 
@@ -52,9 +55,8 @@ def get_file_semantics(path: Path, content: str) -> Dict[str, Any]:
         semantics["functions"] = REGEX_PY_DEF.findall(content)
     
     # 2. Signal Extraction (Cross-Language)
-    for signal_name, regex in SIGNALS.items():
-        if regex.search(content):
-            semantics["signals"].append(signal_name)
+    found = {_SIGNAL_BY_TOKEN[m.lower()] for m in REGEX_SIGNALS.findall(content)}
+    semantics["signals"] = [name for name in SIGNALS if name in found]
             
     return semantics
 
@@ -82,47 +84,71 @@ def get_file_dna(path: Path) -> Dict[str, Any]:
     except Exception:
         return {"name": path.name, "error": "unreadable"}
 
-def generate_local_index(directory: Path) -> Dict[str, Any]:
-    """Generates the V3 Fractal Index for a single directory."""
+def _list_directory(directory: Path) -> tuple[List[str], List[str]]:
+    """Split a directory into (dirnames, filenames) with a single readdir."""
+    dirnames, filenames = [], []
+    with os.scandir(directory) as it:
+        for entry in it:
+            (dirnames if entry.is_dir() else filenames).append(entry.name)
+    return dirnames, filenames
+
+def generate_local_index(
+    directory: Path,
+    ignore_service: SovereignIgnore | None = None,
+    listing: tuple[List[str], List[str]] | None = None,
+) -> Dict[str, Any]:
+    """
+    Generates the V3 Fractal Index for a single directory.
+
+    `listing` is the (dirnames, filenames) pair a caller's walk already produced;
+    when given, the directory is not read from disk a second time.
+    """
     files = []
     children_checksums = {}
     aggregated_signals = set()
     total_classes = 0
     total_functions = 0
     
-    ignore_service = SovereignIgnore(directory)
-    # Finding project root for ignore service
-    try:
-        project_root_path = directory
-        while not (project_root_path / ".git").exists() and project_root_path.parent != project_root_path:
-            project_root_path = project_root_path.parent
-        ignore_service = SovereignIgnore(project_root_path)
-    except:
-        ignore_service = SovereignIgnore(directory)
+    if ignore_service is None:
+        # Finding project root for ignore service
+        try:
+            project_root_path = directory
+            while not (project_root_path / ".git").exists() and project_root_path.parent != project_root_path:
+                project_root_path = project_root_path.parent
+            ignore_service = SovereignIgnore(project_root_path)
+        except:
+            ignore_service = SovereignIgnore(directory)
 
-    has_subdirs = False
-    for item in directory.iterdir():
+    dirnames, filenames = listing if listing is not None else _list_directory(directory)
+
+    for name in filenames:
+        item = directory / name
         if ignore_service.should_ignore(item):
             continue
-            
-        if item.is_file():
-            dna = get_file_dna(item)
-            files.append(dna)
-            if "semantics" in dna:
-                sem = dna["semantics"]
-                aggregated_signals.update(sem.get("signals", []))
-                total_classes += len(sem.get("classes", []))
-                total_functions += len(sem.get("functions", []))
-        elif item.is_dir() and item.name != ".side":
-            has_subdirs = True
-            child_index = item / ".side" / "local.json"
-            if child_index.exists():
-                try:
-                    raw_data = shield.unseal_file(child_index)
-                    data = json.loads(raw_data)
-                    children_checksums[item.name] = data.get("checksum", "unknown")
-                except:
-                    pass
+
+        dna = get_file_dna(item)
+        files.append(dna)
+        if "semantics" in dna:
+            sem = dna["semantics"]
+            aggregated_signals.update(sem.get("signals", []))
+            total_classes += len(sem.get("classes", []))
+            total_functions += len(sem.get("functions", []))
+
+    has_subdirs = False
+    for name in dirnames:
+        item = directory / name
+        if name == ".side" or ignore_service.should_ignore(item):
+            continue
+
+        has_subdirs = True
+        child_index = item / ".side" / "local.json"
+        if child_index.exists():
+            try:
+                raw_data = shield.unseal_file(child_index)
+                data = json.loads(raw_data)
+                children_checksums[item.name] = data.get("checksum", "unknown")
+            except:
+                pass
     
     # --- KARPATHY HEURISTIC (Complexity Analysis) ---
     is_complex = (
@@ -172,15 +198,16 @@ def run_fractal_scan(root: Path):
         if current_dir.name == ".side":
             continue
             
-        dirs_to_process.append(current_dir)
+        # Keep the listing so the indexing pass never re-reads the directory
+        dirs_to_process.append((current_dir, list(dirnames), filenames))
 
     # 2. Bottom-Up Processing Pass (Reverse order)
-    for current_dir in reversed(dirs_to_process):
+    for current_dir, dirnames, filenames in reversed(dirs_to_process):
         # Skip .git and root is handled explicitly if needed, 
         # but reversed(dirs_to_process) includes root at the end.
         
         print(f"🔮 Deep Indexing: {current_dir}")
-        index_data = generate_local_index(current_dir)
+        index_data = generate_local_index(current_dir, ignore_service, (dirnames, filenames))
         
         # SPARSE WRITE LOGIC
         is_root = current_dir == root
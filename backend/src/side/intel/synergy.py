@@ -36,7 +36,7 @@ class SynergyEngine:
         logger.info(f"🌐 [SYNERGY]: Searching Mesh for signals: {signals}")
         
         nodes = self.db.list_mesh_nodes()
-        harvest_count = 0
+        harvested = []
         
         for node in nodes:
             if node['project_id'] == self.project_id:
@@ -52,15 +52,17 @@ class SynergyEngine:
                         # Filter for high-value rejections or decisions
                         if res['type'] in ['REJECTION', 'LEARNING', 'DECISION']:
                             wisdom_id = hashlib.sha256(f"{res['type']}:{res['title']}:{res['detail']}".encode()).hexdigest()[:12]
-                            self.db.save_public_wisdom(
-                                wisdom_id=wisdom_id,
-                                wisdom_text=f"Inherited {res['type']}: {res['title']}. Detail: {res['detail']}",
-                                origin_node=node['name'],
-                                category=res.get('category', 'cross-node'),
-                                signal_pattern=signal
-                            )
-                            harvest_count += 1
+                            harvested.append({
+                                "wisdom_id": wisdom_id,
+                                "wisdom_text": f"Inherited {res['type']}: {res['title']}. Detail: {res['detail']}",
+                                "origin_node": node['name'],
+                                "category": res.get('category', 'cross-node'),
+                                "signal_pattern": signal,
+                            })
                         
+        # One transaction for the whole harvest instead of a commit per entry
+        self.db.save_public_wisdom_batch(harvested)
+        harvest_count = len(harvested)
         if harvest_count > 0:
             logger.info(f"✨ [SYNERGY]: Harvested {harvest_count} strategic patterns from the Universal Mesh.")
         return harvest_count
@@ -34,6 +34,9 @@ class ProactiveForensicObserver:
                 "message": "Potential hardcoded API Secret detected."
             }
         ]
+        # Compile once; scan_file runs on every watched change
+        for rule in self.rules:
+            rule["regex"] = re.compile(rule["pattern"])
 
     def scan_file(self, file_path: Path, content: str) -> List[Dict[str, Any]]:
         """Scans a single file for structural violations."""
@@ -46,7 +49,7 @@ class ProactiveForensicObserver:
             if rule["scope"] != "." and rule["scope"] not in rel_path:
                 continue
                 
-            if re.search(rule["pattern"], content):
+            if rule["regex"].search(content):
                 finding = {
                     "type": rule["id"],
                     "severity": rule["severity"],
@@ -4,6 +4,7 @@ Side Onboarding - Day 1 Magic.
 Auto-creates .side/plan.md and runs baseline audit on first use.
 """
 import os
+import tomllib
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -48,10 +49,13 @@ def detect_project_name(project_root: Path) -> str:
     pyproject = project_root / "pyproject.toml"
     if pyproject.exists():
         try:
-            content = pyproject.read_text()
-            for line in content.split("\n"):
-                if line.strip().startswith("name"):
-                    return line.split("=")[1].strip().strip('"').strip("'")
+            data = tomllib.loads(pyproject.read_text(encoding="utf-8"))
+            name = (
+                data.get("project", {}).get("name")
+                or data.get("tool", {}).get("poetry", {}).get("name")
+            )
+            if name:
+                return name
         except Exception:
             pass
             
@@ -62,7 +66,14 @@ def detect_stack(project_root: Path) -> list[str]:
     """Detect tech stack from project files."""
     stack = []
     
-    if (project_root / "package.json").exists():
+    # One readdir instead of a stat() probe per manifest
+    try:
+        with os.scandir(project_root) as it:
+            root_files = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        root_files = set()
+    
+    if "package.json" in root_files:
         stack.append("Node.js")
         # Check for specific frameworks
         try:
@@ -78,13 +89,13 @@ def detect_stack(project_root: Path) -> list[str]:
         except Exception:
             pass
             
-    if (project_root / "pyproject.toml").exists() or (project_root / "requirements.txt").exists():
+    if "pyproject.toml" in root_files or "requirements.txt" in root_files:
         stack.append("Python")
         
-    if (project_root / "Cargo.toml").exists():
+    if "Cargo.toml" in root_files:
         stack.append("Rust")
         
-    if (project_root / "go.mod").exists():
+    if "go.mod" in root_files:
         stack.append("Go")
         
     return stack if stack else ["Unknown"]
@@ -164,14 +175,15 @@ async def run_onboarding(project_root: str) -> dict:
     root = Path(project_root)
     db = get_database()
     
-    # 1. Get Profile
-    auto_intel = get_auto_intel()
-    profile = await auto_intel.get_or_create_profile(project_root)
-    
-    # Real Forensics Audit (The Spear)
+    # 1. Get Profile + Real Forensics Audit (The Spear).
+    # Independent, so the blocking scan runs in a thread alongside the profile.
     from side.tools.forensics_tool import ForensicsTool
+    auto_intel = get_auto_intel()
     spear = ForensicsTool()
-    findings = spear.scan_project(str(project_root))
+    profile, findings = await asyncio.gather(
+        auto_intel.get_or_create_profile(project_root),
+        asyncio.to_thread(spear.scan_project, str(project_root)),
+    )
     
     # [Anti-Abuse] Claim Trial (Repo Lock) - Uses shared DB
     billing = BillingService(db)
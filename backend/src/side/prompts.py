@@ -17,6 +17,115 @@ from side.intel.intelligence_store import IntelligenceStore
 
 logger = logging.getLogger("side-mcp")
 
+# Prompts whose definitions never change are built once at import; only the
+# finding-count prompts are constructed per listing.
+STRATEGY_PROMPT = Prompt(
+    name="strategy",
+    description="Get strategic advice - 'What should I focus on?'",
+    arguments=[
+        PromptArgument(
+            name="context",
+            description="Optional context about what you're working on",
+            required=False,
+        ),
+    ],
+)
+
+FIX_FLOW_PROMPT = Prompt(
+    name="fix_flow",
+    description="✨ Smart Fix: Auto-resolves the most pressing issue found.",
+    arguments=[]
+)
+
+STANDING_PROMPTS = (
+    # [Experience V2: The CSO Briefing]
+    Prompt(
+        name="brief",
+        description="☀️ Mission Briefing: Strategic status, recent work, and today's focus.",
+        arguments=[]
+    ),
+    # [Experience V2: The CSO Consult]
+    Prompt(
+        name="consult",
+        description="🧠 Strategic Consultation: Get a CTO-level decision on a technical or business choice.",
+        arguments=[
+            PromptArgument(
+                name="question",
+                description="The strategic question (e.g., 'Should we switch to Next.js?')",
+                required=True,
+            ),
+        ]
+    ),
+    # [Experience V2: The CSO Gatekeeper]
+    Prompt(
+        name="verify",
+        description="🛡️ Pre-Flight Check: Verify system health before shipping/deploying.",
+        arguments=[]
+    ),
+    # [Experience V3: The Frontend Guard]
+    Prompt(
+        name="check_design",
+        description="🎨 Design System Guard: Enforce UI consistency and prevent ad-hoc styling.",
+        arguments=[
+            PromptArgument(
+                name="code",
+                description="The code snippet or file content to review.",
+                required=True,
+            )
+        ]
+    ),
+    # [Experience V3: The Truth Engine]
+    Prompt(
+        name="check_truth",
+        description="🔍 Truth Engine: Verify that documentation (README, Vision) matches reality.",
+        arguments=[]
+    ),
+    # [Experience V4: Deep Forensics]
+    Prompt(
+        name="audit_deep",
+        description="🕵️ Deep Recursive Audit: Scan codebase for complex patterns (e.g. 'hardcoded secrets').",
+        arguments=[
+            PromptArgument(
+                name="query",
+                description="What to look for (e.g. 'security vulnerabilities' or 'unused code')",
+                required=True,
+            )
+        ]
+    ),
+)
+
+# Results for prompts that take no arguments and read no state
+FIX_SECURITY_RESULT = GetPromptResult(
+    description="Fix Critical Security Issues",
+    messages=[
+        PromptMessage(
+            role="user",
+            content=TextContent(
+                type="text",
+                text="Hey Side, list all critical/high security issues. For each one:\n1. Explain the risk.\n2. Propose a code fix.\n3. Apply the fix.\n4. Call `verify_fix` to confirm resolution.\n\nCRITICAL: If `verify_fix` fails, you MUST attempt a different fix and verify again. Do NOT report back until the fix is verified as PASS.",
+            ),
+        ),
+    ],
+)
+
+FIX_PERFORMANCE_RESULT = GetPromptResult(
+    description="Fix Critical Performance Issues",
+    messages=[
+        PromptMessage(
+            role="user",
+            content=TextContent(
+                type="text",
+                text="Hey Side, identify the top performance bottlenecks. Focus on N+1 queries and expensive loops. optimize them and verify the speedup.",
+            ),
+        ),
+    ],
+)
+
+STRATEGY_RESULT = GetPromptResult(
+    description="Strategic advice",
+    messages=[PromptMessage(role="user", content=TextContent(type="text", text="Side, what should I focus on?"))],
+)
+
 class DynamicPromptManager:
     def __init__(self):
         # Initialize DB connection for reading findings
@@ -30,19 +139,7 @@ class DynamicPromptManager:
             self.store = None
 
     def get_prompts(self) -> list[Prompt]:
-        prompts = [
-            Prompt(
-                name="strategy",
-                description="Get strategic advice - 'What should I focus on?'",
-                arguments=[
-                    PromptArgument(
-                        name="context",
-                        description="Optional context about what you're working on",
-                        required=False,
-                    ),
-                ],
-            ),
-        ]
+        prompts = [STRATEGY_PROMPT]
         
         if not self.store:
             return prompts
@@ -51,89 +148,33 @@ class DynamicPromptManager:
             # Fetch active high-severity findings
             findings = self.store.get_active_findings(self.project_id)
             
-            # Group by type to avoid spamming prompts
-            security_issues = [f for f in findings if f['severity'] in ['CRITICAL', 'HIGH'] and f.get('metadata', {}).get('dimension') == 'Security']
-            perf_issues = [f for f in findings if f['severity'] in ['CRITICAL', 'HIGH'] and f.get('metadata', {}).get('dimension') == 'Performance']
+            # Group by type to avoid spamming prompts (one pass over findings)
+            security_count = perf_count = 0
+            for f in findings:
+                if f['severity'] in ('CRITICAL', 'HIGH'):
+                    dimension = f.get('metadata', {}).get('dimension')
+                    if dimension == 'Security':
+                        security_count += 1
+                    elif dimension == 'Performance':
+                        perf_count += 1
             
-            if security_issues:
+            if security_count:
                 prompts.append(Prompt(
                     name="fix-security-critical",
-                    description=f"🚨 Fix {len(security_issues)} Critical Security Issues (Auth, Secrets, etc.)",
+                    description=f"🚨 Fix {security_count} Critical Security Issues (Auth, Secrets, etc.)",
                     arguments=[]
                 ))
             
             # [Level 3 Interaction: fix_flow]
             if findings:
-                prompts.append(Prompt(
-                    name="fix_flow",
-                    description="✨ Smart Fix: Auto-resolves the most pressing issue found.",
-                    arguments=[]
-                ))
+                prompts.append(FIX_FLOW_PROMPT)
             
-            # [Experience V2: The CSO Briefing]
-            prompts.append(Prompt(
-                name="brief",
-                description="☀️ Mission Briefing: Strategic status, recent work, and today's focus.",
-                arguments=[]
-            ))
+            prompts.extend(STANDING_PROMPTS)
             
-            # [Experience V2: The CSO Consult]
-            prompts.append(Prompt(
-                name="consult",
-                description="🧠 Strategic Consultation: Get a CTO-level decision on a technical or business choice.",
-                arguments=[
-                     PromptArgument(
-                        name="question",
-                        description="The strategic question (e.g., 'Should we switch to Next.js?')",
-                        required=True,
-                    ),
-                ]
-            ))
-            
-            # [Experience V2: The CSO Gatekeeper]
-            prompts.append(Prompt(
-                name="verify",
-                description="🛡️ Pre-Flight Check: Verify system health before shipping/deploying.",
-                arguments=[]
-            ))
-            
-            # [Experience V3: The Frontend Guard]
-            prompts.append(Prompt(
-                name="check_design",
-                description="🎨 Design System Guard: Enforce UI consistency and prevent ad-hoc styling.",
-                arguments=[
-                    PromptArgument(
-                        name="code",
-                        description="The code snippet or file content to review.",
-                        required=True,
-                    )
-                ]
-            ))
-            
-            # [Experience V3: The Truth Engine]
-            prompts.append(Prompt(
-                name="check_truth",
-                description="🔍 Truth Engine: Verify that documentation (README, Vision) matches reality.",
-                arguments=[]
-            ))
-
-            # [Experience V4: Deep Forensics]
-            prompts.append(Prompt(
-                name="audit_deep",
-                description="🕵️ Deep Recursive Audit: Scan codebase for complex patterns (e.g. 'hardcoded secrets').",
-                arguments=[
-                    PromptArgument(
-                        name="query",
-                        description="What to look for (e.g. 'security vulnerabilities' or 'unused code')",
-                        required=True,
-                    )
-                ]
-            ))
-            
-            if perf_issues:
+            if perf_count:
                 prompts.append(Prompt(
                     name="fix-performance-critical",
-                    description=f"⚡ Fix {len(perf_issues)} Performance bottlenecks (N+1 queries, loops)",
+                    description=f"⚡ Fix {perf_count} Performance bottlenecks (N+1 queries, loops)",
                     arguments=[]
                 ))
                 
@@ -179,8 +220,7 @@ class DynamicPromptManager:
             profile = self.db.get_profile(self.project_id) or {}
             
             # 2. Get Active Plans
-            all_plans = self.db.list_plans()
-            active = [p for p in all_plans if p.get('status') == 'active']
+            active = self.db.list_plans(status="active", limit=1)
             top_focus = active[0]['title'] if active else "No active directives."
             
             # 3. Get Recent Activity (Context)
@@ -347,38 +387,18 @@ class DynamicPromptManager:
             )
             
         if name == "fix-security-critical":
-            return GetPromptResult(
-                description="Fix Critical Security Issues",
-                messages=[
-                    PromptMessage(
-                        role="user",
-                        content=TextContent(
-                            type="text",
-                            text="Hey Side, list all critical/high security issues. For each one:\n1. Explain the risk.\n2. Propose a code fix.\n3. Apply the fix.\n4. Call `verify_fix` to confirm resolution.\n\nCRITICAL: If `verify_fix` fails, you MUST attempt a different fix and verify again. Do NOT report back until the fix is verified as PASS.",
-                        ),
-                    ),
-                ],
-            )
+            return FIX_SECURITY_RESULT
         
         if name == "fix-performance-critical":
-            return GetPromptResult(
-                description="Fix Critical Performance Issues",
-                messages=[
-                    PromptMessage(
-                        role="user",
-                        content=TextContent(
-                            type="text",
-                            text="Hey Side, identify the top performance bottlenecks. Focus on N+1 queries and expensive loops. optimize them and verify the speedup.",
-                        ),
-                    ),
-                ],
-            )
+            return FIX_PERFORMANCE_RESULT
             
         if name == "strategy":
             context = args.get('context', '')
+            if not context:
+                return STRATEGY_RESULT
             return GetPromptResult(
-                description=f"Strategic advice{f' for {context}' if context else ''}",
-                messages=[PromptMessage(role="user", content=TextContent(type="text", text=f"Side, what should I focus on?{f' Context: {context}' if context else ''}"))],
+                description=f"Strategic advice for {context}",
+                messages=[PromptMessage(role="user", content=TextContent(type="text", text=f"Side, what should I focus on? Context: {context}"))],
             )
             
         raise ValueError(f"Unknown prompt: {name}")
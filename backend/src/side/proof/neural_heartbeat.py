@@ -30,7 +30,7 @@ class NeuralHeartbeat:
         Derives health from internal forensic patterns.
         Cost: 0 Network Calls.
         """
-        start_time = time.time_ns()
+        start_time = time.perf_counter_ns()
         
         # 1. Check recent provider failures (Internal Forensic Audit)
         # We query the last 50 activities for 'PROVIDER_FAILURE'
@@ -45,7 +45,7 @@ class NeuralHeartbeat:
         if fail_count > 20:
             status = "CRITICAL"
             
-        elapsed_ms = (time.time_ns() - start_time) / 1_000_000
+        elapsed_ms = (time.perf_counter_ns() - start_time) / 1_000_000
         
         return {
             "status": status,
@@ -1,4 +1,5 @@
 import os
+import re
 import json
 import hashlib
 import base64
@@ -11,6 +12,13 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# PII scrubbers for decision traces: (pattern, replacement)
+_PII_SCRUBBERS = (
+    (re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"), "<EMAIL_REDACTED>"),
+    (re.compile(r"(sk-[a-zA-Z0-9]{20,})"), "<API_KEY_REDACTED>"),
+    (re.compile(r"(ghp_[a-zA-Z0-9]{20,})"), "<GITHUB_TOKEN_REDACTED>"),
+)
+
 class PulseStatus(Enum):
     SECURE = "SECURE"
     DRIFT = "DRIFT"
@@ -51,12 +59,12 @@ class PulseEngine:
         self.anchor_cache: Dict = {}
         self.last_load_time = 0.0
         self.CACHE_TTL = 5.0
+        self._fingerprint_cache: Dict[Path, tuple] = {}
 
     def _load_dynamic_rules(self) -> List[DynamicRule]:
         """Loads rules from the local ledger into RAM (Pre-compiled)."""
         if self.rules_cache: return self.rules_cache
         
-        import re
         rules = []
         for rule_file in self.rules_dir.glob("*.json"):
             try:
@@ -108,10 +116,8 @@ class PulseEngine:
         # 1. PII SCRUBBING (Privacy Moat)
         # Satisfying Board Concern #4: "The Intent Leak Nightmare"
         def scrub_pii(text: str) -> str:
-            import re
-            text = re.sub(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", "<EMAIL_REDACTED>", text)
-            text = re.sub(r"(sk-[a-zA-Z0-9]{20,})", "<API_KEY_REDACTED>", text)
-            text = re.sub(r"(ghp_[a-zA-Z0-9]{20,})", "<GITHUB_TOKEN_REDACTED>", text)
+            for pattern, replacement in _PII_SCRUBBERS:
+                text = pattern.sub(replacement, text)
             return text
 
         scrubbed_fix = scrub_pii(fix_applied)
@@ -135,8 +141,48 @@ class PulseEngine:
         
         return True
 
+    # Lowercase requirements.txt marker -> (fingerprint bucket, name)
+    REQUIREMENT_MARKERS = {
+        "fastapi": ("frameworks", "fastapi"),
+        "django": ("frameworks", "django"),
+        "flask": ("frameworks", "flask"),
+        "redis": ("infra", "redis"),
+        "postgresql": ("infra", "postgres"),
+    }
+
+    # Files whose mtimes stand in for "the repo changed shape" (deps, commits, staged files)
+    FINGERPRINT_SENTINELS = (
+        "requirements.txt", "pyproject.toml", "package.json", "go.mod", "Cargo.toml",
+        ".git/HEAD", ".git/index",
+    )
+
+    def _fingerprint_signature(self, root: Path) -> int:
+        """Max mtime_ns over the root dir and its sentinel files (0 when none exist)."""
+        signature = 0
+        for rel in ("", *self.FINGERPRINT_SENTINELS):
+            try:
+                signature = max(signature, os.stat(root / rel).st_mtime_ns)
+            except OSError:
+                continue
+        return signature
+
     def get_repo_fingerprint(self) -> Dict:
-        """Determines the 'Biology' of the repository for selective sync."""
+        """
+        Determines the 'Biology' of the repository for selective sync.
+        Cached per root until a sentinel file (or the root dir) changes.
+        """
+        root = Path.cwd()
+        signature = self._fingerprint_signature(root)
+        cached = self._fingerprint_cache.get(root)
+        if cached and cached[0] == signature:
+            return {k: list(v) if isinstance(v, list) else v for k, v in cached[1].items()}
+
+        fingerprint = self._scan_repo_fingerprint()
+        self._fingerprint_cache[root] = (signature, fingerprint)
+        return {k: list(v) if isinstance(v, list) else v for k, v in fingerprint.items()}
+
+    def _scan_repo_fingerprint(self) -> Dict:
+        """Walks the working tree to build a fresh fingerprint."""
         fingerprint = {
             "languages": set(),
             "frameworks": set(),
@@ -144,24 +190,31 @@ class PulseEngine:
             "scale": "SMALL" # Default
         }
         
-        # 1. Scan Extensions
-        for ext in [".py", ".js", ".ts", ".go", ".rs"]:
-            if list(Path.cwd().glob(f"**/*{ext}")):
-                fingerprint["languages"].add(ext[1:])
+        # 1 + 3. Scan Extensions and Scale in one walk. Stop as soon as every
+        # language has been seen and the scale threshold is crossed; nothing
+        # further down the tree can change the answer.
+        wanted = {".py", ".js", ".ts", ".go", ".rs"}
+        entries = 0
+        for _, dirnames, filenames in os.walk(Path.cwd()):
+            entries += len(dirnames) + len(filenames)
+            for name in filenames:
+                ext = os.path.splitext(name)[1]
+                if ext in wanted:
+                    wanted.discard(ext)
+                    fingerprint["languages"].add(ext[1:])
+            if not wanted and entries > 500:
+                break
         
-        # 2. Scan Requirements/Packages
+        # 2. Scan Requirements/Packages (lowercased once, then table-driven)
         req_file = Path.cwd() / "requirements.txt"
         if req_file.exists():
             content = req_file.read_text().lower()
-            if "fastapi" in content: fingerprint["frameworks"].add("fastapi")
-            if "django" in content: fingerprint["frameworks"].add("django")
-            if "flask" in content: fingerprint["frameworks"].add("flask")
-            if "redis" in content: fingerprint["infra"].add("redis")
-            if "postgresql" in content: fingerprint["infra"].add("postgres")
-
-        # 3. Scan Scale (Crude heuristic)
-        all_files = list(Path.cwd().glob("**/*"))
-        if len(all_files) > 500:
+            for marker, (bucket, name) in self.REQUIREMENT_MARKERS.items():
+                if marker in content:
+                    fingerprint[bucket].add(name)
+
+        # 3. Scale (Crude heuristic), counted during the walk above
+        if entries > 500:
             fingerprint["scale"] = "ENTERPRISE"
             
         # Convert sets to lists for JSON compatibility
@@ -121,6 +121,6 @@ class CleanupScheduler:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in cleanup loop: {e}", exc_info=True)
+                logger.error("Error in cleanup loop: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                 # Wait 1 hour before retrying
                 await asyncio.sleep(3600)
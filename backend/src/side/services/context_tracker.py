@@ -7,6 +7,7 @@ Analyzes file changes and git activity to understand what user is working on.
 import asyncio
 import logging
 import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,30 @@ from side.storage.simple_db import SimplifiedDatabase
 
 logger = logging.getLogger(__name__)
 
+# Canonical focus labels. Interned once so every saved work context shares
+# a single string object per label instead of a fresh copy per LLM response.
+FOCUS_LABELS = {
+    key: sys.intern(label)
+    for key, label in {
+        "authentication": "Authentication",
+        "api": "API Design",
+        "frontend": "Frontend UI",
+        "database": "Database/Schema",
+        "testing": "Testing",
+        "infrastructure": "Infrastructure/DevOps",
+        "security": "Security",
+        "performance": "Performance",
+        "refactoring": "Refactoring",
+        "general": "General Development",
+    }.items()
+}
+_LABELS_BY_NAME = {label.lower(): label for label in FOCUS_LABELS.values()}
+
+
+def canonical_focus_label(name: str) -> str:
+    """Map a focus label to its interned canonical form (unknown labels pass through)."""
+    return _LABELS_BY_NAME.get(name.strip().lower(), name)
+
 
 class ContextTracker:
     """
@@ -66,17 +91,19 @@ class ContextTracker:
                 if f.is_relative_to(project_path)
             ]
 
-            # Get recent commits
-            recent_commits = self._get_recent_commits(project_path, limit=5)
-
-            # Get current branch
-            current_branch = self._get_current_branch(project_path)
+            # Get recent commits and current branch (one git process).
+            # Blocking git/sqlite work runs in a thread so the event loop keeps
+            # serving tool calls while it waits.
+            recent_commits, current_branch = await asyncio.to_thread(
+                self._get_git_activity, project_path, 5
+            )
 
             # Detect focus area
-            focus_area, confidence = self._detect_focus_area(recent_files, recent_commits)
+            focus_area, confidence = await self._detect_focus_area(recent_files, recent_commits)
 
             # Save to database
-            self.db.save_work_context(
+            await asyncio.to_thread(
+                self.db.save_work_context,
                 project_path=str(project_path),
                 focus_area=focus_area,
                 recent_files=recent_files,
@@ -85,68 +112,73 @@ class ContextTracker:
                 confidence=confidence,
             )
 
-            logger.info(
-                f"Updated context: {focus_area} (confidence: {confidence:.2f})"
-            )
+            logger.info("Updated context: %s (confidence: %.2f)", focus_area, confidence)
 
         except Exception as e:
-            logger.error(f"Error updating context: {e}", exc_info=True)
+            logger.error("Error updating context: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
-    def _get_recent_commits(self, project_path: Path, limit: int = 5) -> list[dict[str, Any]]:
-        """Get recent git commits."""
+    def _get_git_activity(
+        self, project_path: Path, limit: int = 5
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Get recent git commits and the current branch from a single `git log`.
+
+        The branch is read from the ref decorations (%D) of the newest commit,
+        which carry "HEAD -> <branch>" whenever HEAD is attached.
+        """
         try:
             result = subprocess.run(
                 [
                     "git",
                     "log",
                     f"-{limit}",
-                    "--pretty=format:%H|%an|%s|%ct",
+                    "--decorate=full",
+                    "-z",
+                    "--pretty=format:%H%x1f%an%x1f%s%x1f%ct%x1f%D",
                 ],
                 cwd=project_path,
                 capture_output=True,
-                text=True,
                 timeout=5,
             )
 
             if result.returncode != 0:
-                return []
+                return [], None
+
+            # Decode once at the end rather than through a text-mode pipe
+            output = result.stdout.decode("utf-8", "replace")
 
             commits = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
+            branch = None
+            # NUL-terminated records; no strip(), it treats \x1f as whitespace
+            # and would eat an empty %D
+            for record in output.split("\0"):
+                if not record:
                     continue
 
-                parts = line.split("|")
-                if len(parts) == 4:
-                    commits.append({
-                        "hash": parts[0][:8],
-                        "author": parts[1],
-                        "message": parts[2],
-                        "timestamp": int(parts[3]),
-                    })
-
-            return commits
+                parts = record.split("\x1f")
+                if len(parts) != 5:
+                    continue
 
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return []
+                if not commits:
+                    branch = self._branch_from_decorations(parts[4])
+                commits.append({
+                    "hash": parts[0][:8],
+                    "author": parts[1],
+                    "message": parts[2],
+                    "timestamp": int(parts[3]),
+                })
 
-    def _get_current_branch(self, project_path: Path) -> str | None:
-        """Get current git branch."""
-        try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip() or None
+            return commits, branch
 
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
+            return [], None
+
+    @staticmethod
+    def _branch_from_decorations(decorations: str) -> str | None:
+        """Extract the checked-out branch from a full %D decoration string."""
+        for ref in decorations.split(", "):
+            if ref.startswith("HEAD -> refs/heads/"):
+                return ref[len("HEAD -> refs/heads/"):]
         return None
 
     async def _detect_focus_area(
@@ -196,17 +228,18 @@ OUTPUT JSON:
             end = response.rfind("}") + 1
             if start != -1 and end != -1:
                 data = json.loads(response[start:end])
-                return data.get("focus", "General Development"), float(data.get("confidence", 0.5))
+                focus = canonical_focus_label(str(data.get("focus", FOCUS_LABELS["general"])))
+                return focus, float(data.get("confidence", 0.5))
                 
         except Exception as e:
-            logger.warning(f"LLM Focus detection failed: {e}")
+            logger.warning("LLM Focus detection failed: %s", e)
             
         # Fallback to simple heuristic if LLM fails (Software 1.0 backup)
         text = (files_str + commits_str).lower()
-        if "auth" in text or "login" in text: return "Authentication", 0.4
-        if "test" in text: return "Testing", 0.4
+        if "auth" in text or "login" in text: return FOCUS_LABELS["authentication"], 0.4
+        if "test" in text: return FOCUS_LABELS["testing"], 0.4
         
-        return "General Development", 0.3
+        return FOCUS_LABELS["general"], 0.3
 
     def get_current_context(self, project_path: str | Path) -> dict[str, Any] | None:
         """
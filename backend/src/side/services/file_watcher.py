@@ -7,10 +7,10 @@ Watches for file changes, git commits, and triggers knowledge sync.
 import asyncio
 import logging
 import os
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Set
+from typing import Callable, Iterable, Iterator, Set
 
 logger = logging.getLogger(__name__)
 
@@ -49,13 +49,12 @@ class FileWatcher:
         self._changed_files: Set[Path] = set()
         self._last_commit_hash: str | None = None
         self._debounce_task: asyncio.Task | None = None
-
-        self._last_commit_hash: str | None = None
-        self._debounce_task: asyncio.Task | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._git_proc: asyncio.subprocess.Process | None = None
         
         # Use Sovereign Ignore Service
         from side.services.ignore import SovereignIgnore
-        self._ignore_service = SovereignIgnore(Path(root_path))
+        self._ignore_service = SovereignIgnore(self.project_path)
 
 
     async def start(self) -> None:
@@ -65,7 +64,13 @@ class FileWatcher:
             return
 
         self._running = True
-        self._last_commit_hash = self._get_current_commit()
+        self._last_commit_hash = await self._get_current_commit()
+
+        # readdir/stat release the GIL, so subtree scans overlap on slow (network) filesystems
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4),
+            thread_name_prefix="side-watch",
+        )
 
         # Start monitoring task
         self._task = asyncio.create_task(self._watch_loop())
@@ -94,6 +99,12 @@ class FileWatcher:
             except asyncio.CancelledError:
                 pass
 
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        await self._close_git()
+
         logger.info("File watcher stopped")
 
     async def _watch_loop(self) -> None:
@@ -103,21 +114,15 @@ class FileWatcher:
         while self._running:
             try:
                 # Check for git commits
-                current_commit = self._get_current_commit()
+                current_commit = await self._get_current_commit()
                 if current_commit and current_commit != self._last_commit_hash:
-                    logger.info(f"New commit detected: {current_commit[:8]}")
+                    logger.info("New commit detected: %.8s", current_commit)
                     self._last_commit_hash = current_commit
                     # Trigger full rescan on commit
                     await self._trigger_change(set([self.project_path]))
 
                 # Scan for file changes
-                current_scan = {}
-                for file_path in self._walk_files():
-                    try:
-                        stat = file_path.stat()
-                        current_scan[file_path] = (stat.st_mtime, stat.st_size)
-                    except (OSError, PermissionError):
-                        continue
+                current_scan = await self._scan()
 
                 # Detect changes
                 changed = set()
@@ -135,7 +140,7 @@ class FileWatcher:
                         changed.add(path)
 
                 if changed:
-                    logger.debug(f"Detected {len(changed)} changed files")
+                    logger.debug("Detected %d changed files", len(changed))
                     self._changed_files.update(changed)
                     await self._schedule_debounce()
 
@@ -147,51 +152,138 @@ class FileWatcher:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in watch loop: {e}", exc_info=True)
+                logger.error("Error in watch loop: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
                 await asyncio.sleep(5.0)
 
-    def _walk_files(self) -> list[Path]:
-        """Walk project files, respecting ignore patterns."""
-        files = []
-
-        for root, dirs, filenames in os.walk(self.project_path):
-            root_path = Path(root)
-            
-            # Filter out ignored directories
-            # We must modify dirs in-place to prune valid subtrees
-            dirs[:] = [d for d in dirs if not self._ignore_service.should_ignore(root_path / d)]
+    async def _scan(self) -> dict[Path, tuple[float, int]]:
+        """
+        Snapshot (mtime, size) for every watched file.
 
-            for filename in filenames:
-                file_path = root_path / filename
-                
-                # Check if file should be ignored
-                if self._ignore_service.should_ignore(file_path):
-                    continue
+        Each top-level subtree is walked on its own worker thread, so on slow
+        filesystems the directory reads overlap instead of serializing.
+        """
+        loop = asyncio.get_running_loop()
+        files, subdirs = await loop.run_in_executor(
+            self._executor, self._list_dir, self.project_path
+        )
+        parts = await asyncio.gather(
+            loop.run_in_executor(self._executor, self._stat_files, files),
+            *(
+                loop.run_in_executor(self._executor, self._stat_files, self._walk_files(subdir))
+                for subdir in subdirs
+            ),
+        )
+
+        snapshot: dict[Path, tuple[float, int]] = {}
+        for part in parts:
+            snapshot.update(part)
+        return snapshot
+
+    @staticmethod
+    def _stat_files(files: Iterable[Path]) -> dict[Path, tuple[float, int]]:
+        """Stat a batch of files, skipping any that vanish mid-scan."""
+        snapshot = {}
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+                snapshot[file_path] = (stat.st_mtime, stat.st_size)
+            except (OSError, PermissionError):
+                continue
+        return snapshot
 
-                # Skip hidden files
-                if filename.startswith(".") and filename != ".env":
-                    continue
+    def _list_dir(self, directory: Path) -> tuple[list[Path], list[Path]]:
+        """
+        List one directory, returning (watched files, subdirectories to descend).
 
-                files.append(file_path)
+        Uses os.scandir so ignored directories (node_modules, .venv, ...) are
+        pruned before we ever list them, and file/dir checks reuse the d_type
+        from readdir instead of issuing a stat per entry.
+        """
+        should_ignore = self._ignore_service.should_ignore
+        files: list[Path] = []
+        subdirs: list[Path] = []
 
-        return files
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return files, subdirs
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dir_path = Path(entry.path)
+                if not should_ignore(dir_path):
+                    subdirs.append(dir_path)
+                continue
+
+            # Symlinked directories are listed but never followed (os.walk parity)
+            if entry.is_symlink() and entry.is_dir():
+                continue
+
+            # Skip hidden files
+            if entry.name.startswith(".") and entry.name != ".env":
+                continue
+
+            file_path = Path(entry.path)
+            if should_ignore(file_path):
+                continue
+
+            files.append(file_path)
+
+        return files, subdirs
+
+    def _walk_files(self, top: Path | None = None) -> Iterator[Path]:
+        """Walk project files depth-first from `top`, respecting ignore patterns."""
+        stack = [top or self.project_path]
+        while stack:
+            files, subdirs = self._list_dir(stack.pop())
+            stack.extend(subdirs)
+            yield from files
+
+    async def _get_current_commit(self) -> str | None:
+        """
+        Get current git commit hash.
 
-    def _get_current_commit(self) -> str | None:
-        """Get current git commit hash."""
+        Polled every loop iteration, so HEAD is resolved through one long-lived
+        `git cat-file --batch-check` process instead of a fresh git per second.
+        """
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+            if self._git_proc is None or self._git_proc.returncode is not None:
+                self._git_proc = await asyncio.create_subprocess_exec(
+                    "git", "cat-file", "--batch-check",
+                    cwd=self.project_path,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            self._git_proc.stdin.write(b"HEAD\n")
+            await self._git_proc.stdin.drain()
+            line = await asyncio.wait_for(self._git_proc.stdout.readline(), timeout=2)
+        except (asyncio.TimeoutError, OSError) as e:
+            logger.debug("git cat-file worker failed, restarting next poll: %s", e)
+            await self._close_git()
+            return None
+
+        # "<sha> commit <size>" on success, "HEAD missing" before the first commit
+        fields = line.split()
+        if len(fields) == 3 and fields[1] == b"commit":
+            return fields[0].decode("ascii")
+        if not line:
+            # Worker exited (e.g. not a git repository); respawned on the next poll
+            await self._close_git()
         return None
 
+    async def _close_git(self) -> None:
+        """Shut down the cat-file worker, if any."""
+        proc, self._git_proc = self._git_proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=1)
+        except (asyncio.TimeoutError, OSError):
+            proc.kill()
+
     async def _schedule_debounce(self) -> None:
         """Schedule debounced callback."""
         # Cancel existing debounce
@@ -211,14 +303,14 @@ class FileWatcher:
                 changed = self._changed_files.copy()
                 self._changed_files.clear()
 
-                logger.info(f"Triggering change callback for {len(changed)} files")
+                logger.info("Triggering change callback for %d files", len(changed))
                 try:
                     # Call callback (may be sync or async)
                     result = self.on_change(changed)
                     if asyncio.iscoroutine(result):
                         await result
                 except Exception as e:
-                    logger.error(f"Error in change callback: {e}", exc_info=True)
+                    logger.error("Error in change callback: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
         except asyncio.CancelledError:
             pass
@@ -231,4 +323,4 @@ class FileWatcher:
                 if asyncio.iscoroutine(result):
                     await result
             except Exception as e:
-                logger.error(f"Error in change callback: {e}", exc_info=True)
+                logger.error("Error in change callback: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
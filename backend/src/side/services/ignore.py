@@ -17,7 +17,7 @@ class SovereignIgnore:
     """
     
     # Defaults: What we ALWAYS ignore unless told otherwise.
-    DEFAULT_IGNORES = {
+    DEFAULT_IGNORES = frozenset({
         # SCM / System
         ".git", ".svn", ".hg", ".DS_Store",
         # Dependencies / Build
@@ -27,7 +27,7 @@ class SovereignIgnore:
         ".side", ".side-id",
         # Common huge folders
         "coverage", "tmp", "temp", "logs"
-    }
+    })
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
@@ -6,8 +6,10 @@ strategic friction or vision drift.
 """
 
 import logging
+import os
+import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 
 from side.storage.simple_db import SimplifiedDatabase
 
@@ -19,6 +21,13 @@ class ProactiveService:
     Checks for TODO/HACK comments and cross-references them with active goals.
     """
 
+    # One alternation instead of a membership test per marker per line
+    _MARKERS = ("TODO", "HACK", "FIXME", "XXX")
+    # We limit scan to source files
+    SOURCE_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.tsx', '.go', '.rs', '.java'})
+    EXCLUDED_DIRS = frozenset({'.git', 'node_modules', '__pycache__', 'venv', 'env', 'dist', 'build'})
+    _MARKER_RE = re.compile("|".join(_MARKERS))
+
     def __init__(self, db: SimplifiedDatabase, project_path: Path):
         self.db = db
         self.project_path = project_path
@@ -33,40 +42,60 @@ class ProactiveService:
         active_plans = self.db.list_plans(self.db.get_project_id(), status="active")
         
         # 2. Scan for Technical Signals (TODO, HACK, FIXME)
-        # We limit scan to source files
-        extensions = {'.py', '.js', '.ts', '.tsx', '.go', '.rs', '.java'}
-        excludes = {'.git', 'node_modules', '__pycache__', 'venv', 'env', 'dist', 'build'}
-        
-        for path in self.project_path.rglob('*'):
-            if path.is_file() and path.suffix in extensions:
-                # Basic exclude check
-                if any(part in excludes for part in path.parts):
-                    continue
-                    
+        for full_path, rel_path in self._iter_source_files(self.SOURCE_EXTENSIONS, self.EXCLUDED_DIRS):
                 try:
-                    content = path.read_text(errors='ignore')
-                    lines = content.splitlines()
-                    for i, line in enumerate(lines):
-                        if any(marker in line for marker in ["TODO", "HACK", "FIXME", "XXX"]):
-                            clean_line = line.strip()[:200]
-                            rel_path = str(path.relative_to(self.project_path))
-                            
-                            # Software 2.0 Analysis
-                            judgement = await self.analyze_signal(clean_line, rel_path, i + 1)
-                            
-                            if judgement:
-                                findings.append({
-                                    "type": judgement.get("type", "risk"),
-                                    "message": judgement.get("message"),
-                                    "file": rel_path,
-                                    "line": i + 1,
-                                    "context": clean_line
-                                })
+                    with open(full_path, encoding="utf-8", errors="ignore") as fh:
+                        content = fh.read()
+                    # Most files carry no markers; a substring sweep is far cheaper than the regex
+                    if not any(marker in content for marker in self._MARKERS):
+                        continue
+                    line_end = -1
+                    for match in self._MARKER_RE.finditer(content):
+                        # Several markers on one line still count as one signal
+                        if match.start() < line_end:
+                            continue
+                        line_start = content.rfind("\n", 0, match.start()) + 1
+                        line_end = content.find("\n", match.end())
+                        if line_end == -1:
+                            line_end = len(content)
+                        line_no = content.count("\n", 0, line_start) + 1
+                        clean_line = content[line_start:line_end].strip()[:200]
+                        
+                        # Software 2.0 Analysis
+                        judgement = await self.analyze_signal(clean_line, rel_path, line_no)
+                        
+                        if judgement:
+                            findings.append({
+                                "type": judgement.get("type", "risk"),
+                                "message": judgement.get("message"),
+                                "file": rel_path,
+                                "line": line_no,
+                                "context": clean_line
+                            })
                 except Exception:
                     pass
                     
         return findings
 
+    def _iter_source_files(
+        self, extensions: frozenset, excludes: frozenset
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Yields (full_path, rel_path) for source files under the project.
+        Excluded directories are pruned before descent, and paths stay plain
+        strings so the hot loop does no pathlib work.
+        """
+        root = str(self.project_path)
+        prefix_len = len(os.path.join(root, ""))
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in excludes]
+            for name in filenames:
+                dot = name.rfind(".")
+                if dot <= 0 or name[dot:] not in extensions:
+                    continue
+                full_path = os.path.join(dirpath, name)
+                yield full_path, full_path[prefix_len:]
+
     async def analyze_signal(self, comment: str, file_path: str, line_no: int) -> Dict[str, Any] | None:
         """
         [Software 2.0] Uses the LLM to judge if a technical signal is a strategic risk.
@@ -7,11 +7,11 @@ Manages lifecycle of all background services (file watcher, cache warmer, etc.)
 import asyncio
 import logging
 import signal
+from functools import cached_property
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
-from side.services.file_watcher import FileWatcher
 from side.services.file_watcher import FileWatcher
 
 logger = logging.getLogger(__name__)
@@ -39,6 +39,18 @@ class ServiceManager:
         self._running = False
         self._services: Dict[str, Any] = {}
         self._health_task: asyncio.Task | None = None
+        # Set by stop(); waiters sleep on it instead of polling _running
+        self._stop_event = asyncio.Event()
+        # Services push (name, task_alive) here so a crashed task is reported at once;
+        # task_alive is None for "re-check my flags" (see report_health)
+        self._health_queue: asyncio.Queue[tuple[str, bool | None]] = asyncio.Queue()
+        self._exited: set[str] = set()
+
+        # Trailing-edge debounce for file-change bursts
+        self._pending_files: set[Path] = set()
+        self._pending_update: asyncio.Task | None = None
+        # Shielded batches already being processed; stop() waits for these
+        self._flush_tasks: set[asyncio.Task] = set()
 
         # Service status
         self._status = {
@@ -46,6 +58,13 @@ class ServiceManager:
             "services": {},
         }
 
+    @cached_property
+    def _db(self):
+        """Database shared by every service (opened on first use)."""
+        from side.storage.simple_db import SimplifiedDatabase
+
+        return SimplifiedDatabase()
+
     async def start(self) -> None:
         """Start all background services."""
         if self._running:
@@ -53,25 +72,27 @@ class ServiceManager:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._status["started_at"] = datetime.now(timezone.utc).isoformat()
 
         logger.info("Starting sideMCP background services...")
 
         try:
-            # Start file watcher
-            await self._start_file_watcher()
-
-            # Start context tracker
-            await self._start_context_tracker()
-
-            # Start cleanup scheduler
-            await self._start_cleanup_scheduler()
-
-            # Start Supabase Sync
-            await self._start_supabase_sync()
-
-            # Start Telemetry
-            await self._start_telemetry()
+            # Each service registers under its own key, so they can start
+            # concurrently; startup takes as long as the slowest one.
+            # Failures don't cancel siblings: the first one is re-raised as-is
+            # into the handler below.
+            results = await asyncio.gather(
+                self._start_file_watcher(),
+                self._start_context_tracker(),
+                self._start_cleanup_scheduler(),
+                self._start_supabase_sync(),
+                self._start_telemetry(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
             # Start health monitoring
             self._health_task = asyncio.create_task(self._health_monitor())
@@ -86,6 +107,10 @@ class ServiceManager:
 
         except Exception as e:
             logger.error(f"Failed to start services: {e}", exc_info=True)
+            # gather() let the siblings finish starting; stop every one that
+            # registered itself so nothing is left running behind the error.
+            if self._services:
+                logger.info("Stopping services that did start: %s", ", ".join(self._services))
             await self.stop()
             raise
 
@@ -97,6 +122,7 @@ class ServiceManager:
         logger.info("Stopping sideMCP background services...")
 
         self._running = False
+        self._stop_event.set()
 
         # Stop reaper
         if hasattr(self, "_reaper_task") and self._reaper_task:
@@ -106,6 +132,14 @@ class ServiceManager:
             except asyncio.CancelledError:
                 pass
 
+        # Drop any debounced file-change batch that has not fired yet
+        if self._pending_update and not self._pending_update.done():
+            self._pending_update.cancel()
+
+        # Let a batch that is already processing finish before its services stop
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
         # Stop health monitor
         if self._health_task:
             self._health_task.cancel()
@@ -150,6 +184,8 @@ class ServiceManager:
             "started_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        self._watch_health("file_watcher", watcher)
+
         logger.info("✅ File watcher started")
 
     async def _start_context_tracker(self) -> None:
@@ -157,10 +193,8 @@ class ServiceManager:
         logger.info("Starting context tracker...")
 
         from side.services.context_tracker import ContextTracker
-        from side.storage.simple_db import SimplifiedDatabase
 
-        db = SimplifiedDatabase()
-        tracker = ContextTracker(db)
+        tracker = ContextTracker(self._db)
 
         self._services["context_tracker"] = tracker
         self._status["services"]["context_tracker"] = {
@@ -168,6 +202,8 @@ class ServiceManager:
             "started_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        self._watch_health("context_tracker", tracker)
+
         logger.info("✅ Context tracker started")
 
 
@@ -177,10 +213,8 @@ class ServiceManager:
         logger.info("Starting cleanup scheduler...")
 
         from side.services.cleanup_scheduler import CleanupScheduler
-        from side.storage.simple_db import SimplifiedDatabase
 
-        db = SimplifiedDatabase()
-        scheduler = CleanupScheduler(db)
+        scheduler = CleanupScheduler(self._db)
 
         await scheduler.start()
 
@@ -191,6 +225,8 @@ class ServiceManager:
             "schedule": "Daily at 3 AM"
         }
 
+        self._watch_health("cleanup_scheduler", scheduler)
+
         logger.info("✅ Cleanup scheduler started")
 
     async def _start_supabase_sync(self) -> None:
@@ -200,11 +236,10 @@ class ServiceManager:
         from side.services.supabase_sync import SupabaseSyncService
         from side.storage.simple_db import SimplifiedDatabase
 
-        # Initialize DB and Project ID
-        db = SimplifiedDatabase()
+        # Initialize Project ID (DB is shared)
         project_id = SimplifiedDatabase.get_project_id(self.project_path)
 
-        sync_service = SupabaseSyncService(db, project_id)
+        sync_service = SupabaseSyncService(self._db, project_id)
         
         # Start in background task since it runs forever
         sync_task = asyncio.create_task(sync_service.run_forever(interval=300))
@@ -215,6 +250,8 @@ class ServiceManager:
             "started_at": datetime.now(timezone.utc).isoformat(),
         }
 
+        self._watch_health("supabase_sync", sync_task)
+
         logger.info("✅ Supabase sync started")
 
     async def _start_background_engines(self) -> None:
@@ -228,7 +265,7 @@ class ServiceManager:
         from side.storage.simple_db import SimplifiedDatabase
 
         self.tasks = [] # Initialize list to hold background tasks
-        self.db = SimplifiedDatabase() # Initialize DB for engines
+        self.db = self._db # Shared DB for engines
         project_id = SimplifiedDatabase.get_project_id(self.project_path)
         
         # 1. Telemetry (Anonymous Heartbeat)
@@ -257,9 +294,31 @@ class ServiceManager:
         """
         Callback when files change.
 
+        Batches changes and (re)arms a short trailing debounce, so a burst of
+        callbacks during a large refactor triggers one context update.
+        """
+        self._pending_files.update(files)
+        if self._pending_update and not self._pending_update.done():
+            self._pending_update.cancel()
+        self._pending_update = asyncio.create_task(self._flush_file_changes(delay=1.0))
+
+    async def _flush_file_changes(self, delay: float) -> None:
+        """Process the accumulated batch once no new change arrived for `delay` seconds."""
+        await asyncio.sleep(delay)
+        if not self._running:
+            return
+        files, self._pending_files = self._pending_files, set()
+        # Once started, the batch runs to completion even if a new burst re-arms the debounce
+        task = asyncio.create_task(self._process_file_changes(files))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+        await asyncio.shield(task)
+
+    async def _process_file_changes(self, files: set[Path]) -> None:
+        """
         Triggers knowledge sync and context update.
         """
-        logger.info(f"Files changed: {len(files)} files")
+        logger.info("Files changed: %d files", len(files))
 
         # Update work context
         if "context_tracker" in self._services:
@@ -268,7 +327,7 @@ class ServiceManager:
                 await tracker.update_context(self.project_path, files) # changed_files -> files
                 logger.debug("Work context updated")
             except Exception as e:
-                logger.error(f"Error updating context: {e}", exc_info=True)
+                logger.error("Error updating context: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
         # [V2: Invisible Intelligence] Trigger Proactive Audit
         if "auditor" in self._services:
@@ -278,38 +337,60 @@ class ServiceManager:
                 await auditor_service.auditor.quick_scan(files)
                 logger.info("Proactive V2 Audit complete (Invisible Layer)")
             except Exception as e:
-                logger.error(f"Proactive Audit failed: {e}")
+                logger.error("Proactive Audit failed: %s", e)
 
     async def _health_monitor(self) -> None:
-        """Monitor service health."""
+        """Apply health events as services push them (no periodic polling)."""
         while self._running:
             try:
-                # Check each service
-                for name, service in self._services.items():
-                    is_healthy = True
+                name, alive = await self._health_queue.get()
+                if alive is True:
+                    self._exited.discard(name)
+                elif alive is False:
+                    self._exited.add(name)
 
-                    # Check if service has health check method
-                    if hasattr(service, "is_healthy"):
-                        is_healthy = await service.is_healthy()
+                await self._update_health(name)
 
-                    # Check if service is still running
-                    if hasattr(service, "_running"):
-                        is_healthy = is_healthy and service._running
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error in health monitor: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
-                    # Update status
-                    if name in self._status["services"]:
-                        self._status["services"][name]["healthy"] = is_healthy
+    async def _update_health(self, name: str) -> None:
+        """Combine a service's task-exit state with its own health flags."""
+        service = self._services.get(name)
+        if service is None:
+            return
 
-                    if not is_healthy:
-                        logger.warning(f"Service {name} is unhealthy")
+        is_healthy = name not in self._exited
 
-                # Wait before next check
-                await asyncio.sleep(30)  # Check every 30 seconds
+        # Check if service has health check method
+        if hasattr(service, "is_healthy"):
+            is_healthy = is_healthy and await service.is_healthy()
+
+        # Check if service is still running
+        if hasattr(service, "_running"):
+            is_healthy = is_healthy and service._running
+
+        # Update status
+        if name in self._status["services"]:
+            self._status["services"][name]["healthy"] = is_healthy
+
+        if not is_healthy and self._running:
+            logger.warning("Service %s is unhealthy", name)
+
+    def report_health(self, name: str) -> None:
+        """Ask the monitor to re-check `name`; services call this when their own state changes."""
+        self._health_queue.put_nowait((name, None))
+
+    def _watch_health(self, name: str, service: Any) -> None:
+        """Report a service's task alive now, and exited as soon as it finishes."""
+        self._health_queue.put_nowait((name, True))
+
+        task = service if isinstance(service, asyncio.Task) else getattr(service, "_task", None)
+        if task is not None:
+            task.add_done_callback(lambda _: self._health_queue.put_nowait((name, False)))
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in health monitor: {e}", exc_info=True)
     async def _service_reaper(self) -> None:
         """
         [Hyper-Ralph] The Service Reaper.
@@ -342,12 +423,12 @@ class ServiceManager:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in service reaper: {e}", exc_info=True)
+                logger.error("Error in service reaper: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             for sig in (signal.SIGTERM, signal.SIGINT):
                 loop.add_signal_handler(
@@ -369,8 +450,7 @@ class ServiceManager:
         await self.start()
 
         # Wait until stopped
-        while self._running:
-            await asyncio.sleep(1)
+        await self._stop_event.wait()
 
 
 async def main() -> None:
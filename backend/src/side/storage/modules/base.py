@@ -2,15 +2,75 @@
 Sovereign Base Engine - Core SQLite Connectivity.
 """
 
+import json
 import sqlite3
 import logging
-from contextlib import contextmanager
+import threading
+import zlib
+from contextlib import closing, contextmanager
 from pathlib import Path
 from typing import Generator, Any
 from datetime import datetime, timezone
 
+# orjson is several times faster at (de)serializing the JSON columns; optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Expiry columns hold INTEGER unix microseconds: range checks are integer
+# compares and index entries are 8 bytes instead of a 32-char ISO string.
+# SQL_NOW_US is the same clock evaluated inside SQLite (for triggers).
+SQL_NOW_US = "CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER)"
+# Upper bound on expired rows a single insert-trigger sweep deletes
+TTL_SWEEP_LIMIT = 32
+# JSON payloads at least this large are stored zlib-compressed as BLOBs
+COMPRESS_MIN_BYTES = 256
+
+
+def json_dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Compact JSON text for storage (orjson if installed, same layout from stdlib otherwise)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_dumpb(obj: Any, sort_keys: bool = False) -> bytes:
+    """json_dumps as UTF-8 bytes, skipping orjson's decode when the caller wants bytes anyway."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def pack_json(text: str) -> str | bytes:
+    """Store large JSON text as a zlib BLOB; small payloads stay plain TEXT."""
+    data = text.encode()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return text
+    return zlib.compress(data, 1)
+
+
+def unpack_json(value: Any) -> Any:
+    """Inverse of pack_json: the SQLite storage class (BLOB vs TEXT) tells them apart."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode()
+    return value
+
+
+def epoch_us(dt: datetime | None = None) -> int:
+    """Unix microseconds for `dt` (default: now, UTC), as stored in expiry columns."""
+    if dt is None:
+        dt = datetime.now(timezone.utc)
+    return int(dt.timestamp() * 1_000_000)
+
 class InsufficientTokensError(Exception):
     """Raised when the user has run out of Strategic Units (SU)."""
     pass
@@ -25,42 +85,77 @@ class SovereignEngine:
             db_path = Path.home() / ".side" / "local.db"
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection per thread, opened on first use
+        self._local = threading.local()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a SQLite connection and apply the pragmas once."""
+        conn = sqlite3.connect(
+            self.db_path, 
+            timeout=30.0,
+            check_same_thread=False,
+            # The connection lives for the thread, so keep every statement the
+            # stores issue prepared (the default cache holds 128)
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        
+        # Optimize for speed and resilience.
+        # auto_vacuum only takes effect on a fresh file, so it must precede the
+        # WAL switch (which writes the header); it lets cleanup return freed pages.
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL") 
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        return conn
 
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
-        Create a thread-safe SQLite connection with optimized pragmas.
+        Yield this thread's SQLite connection, opening it on first use.
+
+        Nested blocks share the outer transaction: only the outermost one
+        commits or rolls back.
         """
-        try:
-            conn = sqlite3.connect(
-                self.db_path, 
-                timeout=30.0,
-                check_same_thread=False
-            )
-            conn.row_factory = sqlite3.Row
-            
-            # Optimize for speed and resilience
-            conn.execute("PRAGMA journal_mode=WAL") 
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA foreign_keys=ON")
-            
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None:
             try:
-                yield conn
-                conn.commit()
+                conn = self._open()
             except sqlite3.OperationalError as e:
                 if "database or disk is full" in str(e).lower():
-                    logger.critical(f"FATAL: Database or disk is full at {self.db_path}. Intelligence persistence disabled.")
-                conn.rollback()
-                raise
-            except Exception:
-                conn.rollback()
+                    logger.critical(f"FATAL: Could not open database. Disk full at {self.db_path}.")
                 raise
-            finally:
-                conn.close()
+            local.conn = conn
+            local.depth = 0
+
+        local.depth += 1
+        try:
+            yield conn
+            if local.depth == 1:
+                conn.commit()
         except sqlite3.OperationalError as e:
             if "database or disk is full" in str(e).lower():
-                logger.critical(f"FATAL: Could not open database. Disk full at {self.db_path}.")
+                logger.critical(f"FATAL: Database or disk is full at {self.db_path}. Intelligence persistence disabled.")
+            if local.depth == 1:
+                conn.rollback()
             raise
+        except Exception:
+            if local.depth == 1:
+                conn.rollback()
+            raise
+        finally:
+            local.depth -= 1
+
+    def close(self) -> None:
+        """Close this thread's connection; the next use reopens it."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     def check_integrity(self) -> bool:
         """Run a forensic SQLite integrity check."""
@@ -77,9 +172,11 @@ class SovereignEngine:
         bak_path = self.db_path.with_suffix(".db.bak")
         if self.db_path.exists():
             try:
-                import shutil
                 if self.check_integrity():
-                    shutil.copy2(self.db_path, bak_path)
+                    # Online backup API: the open connection may still hold
+                    # frames in the WAL that a plain file copy would miss
+                    with self.connection() as conn, closing(sqlite3.connect(bak_path)) as bak:
+                        conn.backup(bak)
                     logger.debug("Disaster Recovery: Atomic backup created.")
             except Exception as e:
                 logger.warning(f"Disaster Recovery: Backup failed: {e}")
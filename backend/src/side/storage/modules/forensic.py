@@ -2,15 +2,53 @@
 Sovereign Forensic Store - Audits, Activities, & Work Context.
 """
 
-import json
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from side.utils.crypto import shield
-from .base import SovereignEngine, InsufficientTokensError
+from .base import SovereignEngine, InsufficientTokensError, SQL_NOW_US, TTL_SWEEP_LIMIT, epoch_us, json_dumps, json_loads, pack_json, unpack_json
 
 logger = logging.getLogger(__name__)
 
+# Hot-path statements, hoisted so every call hits the same prepared statement
+_SQL_LOG_ACTIVITY = """
+    INSERT INTO activities (
+        project_id, tool, action, cost_tokens, tier, payload
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_SAVE_WORK_CONTEXT = """
+    INSERT INTO work_context (
+        project_path, focus_area, recent_files, recent_commits,
+        current_branch, expires_at, confidence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_LATEST_WORK_CONTEXT = """
+    SELECT * FROM work_context 
+    WHERE project_path = ? AND expires_at > ?
+    ORDER BY detected_at DESC LIMIT 1
+"""
+
+
+# The context tracker re-saves the same recent files/commits on every change
+# burst; memoize their serialized form keyed on a hashable snapshot.
+@lru_cache(maxsize=256)
+def _dumps_files(files: tuple[str, ...]) -> str | bytes:
+    return pack_json(json_dumps(list(files)))
+
+
+@lru_cache(maxsize=256)
+def _dumps_records(records: tuple[tuple[tuple[str, Any], ...], ...]) -> str | bytes:
+    return pack_json(json_dumps([dict(items) for items in records]))
+
+
+def _dumps_commits(commits: list[dict[str, Any]]) -> str | bytes:
+    try:
+        return _dumps_records(tuple(tuple(c.items()) for c in commits))
+    except TypeError:  # unhashable values: serialize directly
+        return pack_json(json_dumps(commits))
+
+
 class ForensicStore:
     def __init__(self, engine: SovereignEngine):
         self.engine = engine
@@ -48,11 +86,26 @@ class ForensicStore:
                 recent_commits JSON,
                 current_branch TEXT,
                 detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                expires_at TIMESTAMP,
+                expires_at INTEGER,
                 confidence FLOAT DEFAULT 0.0
             )
         """)
         conn.execute("CREATE INDEX IF NOT EXISTS idx_work_context_path ON work_context(project_path)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_work_context_expires ON work_context(expires_at) "
+            "WHERE expires_at IS NOT NULL"
+        )
+        # Incremental TTL: each insert sweeps a bounded batch of older expired rows
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_work_context_ttl AFTER INSERT ON work_context
+            BEGIN
+                DELETE FROM work_context WHERE rowid IN (
+                    SELECT rowid FROM work_context
+                    WHERE expires_at < {SQL_NOW_US} AND rowid != NEW.rowid
+                    LIMIT {TTL_SWEEP_LIMIT}
+                );
+            END
+        """)
 
         # ─────────────────────────────────────────────────────────────
         # CORE TABLE 11: ACTIVITIES - System Logs
@@ -100,14 +153,10 @@ class ForensicStore:
                     raise InsufficientTokensError(f"Insufficient tokens. {balance} remaining.")
 
             # SEAL SENSITIVE PAYLOAD
-            sealed_payload = shield.seal(json.dumps(payload or {}))
+            sealed_payload = shield.seal(json_dumps(payload or {}))
 
             conn.execute(
-                """
-                INSERT INTO activities (
-                    project_id, tool, action, cost_tokens, tier, payload
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_LOG_ACTIVITY,
                 (project_id, tool, action, cost_tokens, tier, sealed_payload)
             )
             
@@ -129,11 +178,11 @@ class ForensicStore:
                 d = dict(row)
                 if d.get("payload"):
                     try:
-                        d["payload"] = json.loads(shield.unseal(d["payload"]))
+                        d["payload"] = json_loads(shield.unseal(d["payload"]))
                     except Exception:
                         # Fallback for old unencrypted data
                         try:
-                            d["payload"] = json.loads(d["payload"])
+                            d["payload"] = json_loads(d["payload"])
                         except Exception:
                              d["payload"] = {"error": "[PAYLOAD_SEALED]"}
                 results.append(d)
@@ -164,34 +213,25 @@ class ForensicStore:
         expires_at = datetime.now(timezone.utc) + timedelta(days=7)
         with self.engine.connection() as conn:
             conn.execute(
-                """
-                INSERT INTO work_context (
-                    project_path, focus_area, recent_files, recent_commits,
-                    current_branch, expires_at, confidence
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (project_path, focus_area, json.dumps(recent_files),
-                 json.dumps(recent_commits), current_branch,
-                 expires_at.isoformat(), confidence),
+                _SQL_SAVE_WORK_CONTEXT,
+                (project_path, focus_area, _dumps_files(tuple(recent_files)),
+                 _dumps_commits(recent_commits), current_branch,
+                 epoch_us(expires_at), confidence),
             )
 
     def get_latest_work_context(self, project_path: str) -> dict[str, Any] | None:
         """Get latest work context."""
         with self.engine.connection() as conn:
             row = conn.execute(
-                """
-                SELECT * FROM work_context 
-                WHERE project_path = ? AND expires_at > ?
-                ORDER BY detected_at DESC LIMIT 1
-                """,
-                (project_path, datetime.now(timezone.utc).isoformat()),
+                _SQL_LATEST_WORK_CONTEXT,
+                (project_path, epoch_us()),
             ).fetchone()
             if row is None:
                 return None
             return {
                 "focus_area": row["focus_area"],
-                "recent_files": json.loads(row["recent_files"]) if row["recent_files"] else [],
-                "recent_commits": json.loads(row["recent_commits"]) if row["recent_commits"] else [],
+                "recent_files": json_loads(unpack_json(row["recent_files"])) if row["recent_files"] else [],
+                "recent_commits": json_loads(unpack_json(row["recent_commits"])) if row["recent_commits"] else [],
                 "current_branch": row["current_branch"],
                 "detected_at": row["detected_at"],
                 "confidence": row["confidence"],
@@ -199,17 +239,13 @@ class ForensicStore:
 
     def cleanup_expired_data(self) -> dict[str, int]:
         """Cleanup expired forensic data."""
-        now = datetime.now(timezone.utc).isoformat()
+        now = epoch_us()
         deleted = {}
         with self.engine.connection() as conn:
             # Cleanup work_context
             cursor = conn.execute("DELETE FROM work_context WHERE expires_at < ?", (now,))
             deleted["work_context"] = cursor.rowcount
             
-            # Cleanup query_cache (will be handled by OperationalStore but listed here for consistency if needed)
-            # Actually, let's keep it here if it's considered forensic/cleanup.
-            # But the plan says TransientStore handles it.
-            
             return deleted
 
     def prune_activities(self, days: int = 30) -> int:
@@ -2,12 +2,11 @@
 Sovereign Identity Store - Profile & Economy Management.
 """
 
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from side.utils.helpers import safe_get
-from .base import SovereignEngine, InsufficientTokensError
+from .base import SovereignEngine, InsufficientTokensError, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +95,7 @@ class IdentityStore:
                     profile_data.get("stage"),
                     profile_data.get("business_model"),
                     profile_data.get("target_raise"),
-                    json.dumps(tech_stack) if tech_stack else None,
+                    json_dumps(tech_stack) if tech_stack else None,
                     profile_data.get("tier"),
                     profile_data.get("token_balance"),
                     profile_data.get("tokens_monthly"),
@@ -113,7 +112,7 @@ class IdentityStore:
             ).fetchone()
             
             if row:
-                tech_stack = json.loads(row["tech_stack"]) if row["tech_stack"] else {}
+                tech_stack = json_loads(row["tech_stack"]) if row["tech_stack"] else {}
                 return {
                     "id": row["id"],
                     "name": row["name"],
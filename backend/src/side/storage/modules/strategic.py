@@ -158,7 +158,8 @@ class StrategicStore:
             row = conn.execute("SELECT * FROM plans WHERE id = ?", (plan_id,)).fetchone()
             return dict(row) if row else None
 
-    def list_plans(self, project_id: str | None = None, plan_type: str | None = None, status: str | None = None) -> list[dict[str, Any]]:
+    def list_plans(self, project_id: str | None = None, plan_type: str | None = None, status: str | None = None,
+                   limit: int | None = None) -> list[dict[str, Any]]:
         """List plans, optionally filtered."""
         with self.engine.connection() as conn:
             query = "SELECT * FROM plans WHERE 1=1"
@@ -173,9 +174,40 @@ class StrategicStore:
                 query += " AND status = ?"
                 params.append(status)
             query += " ORDER BY priority DESC, due_date"
+            if limit is not None:
+                query += " LIMIT ?"
+                params.append(limit)
             rows = conn.execute(query, params).fetchall()
             return [dict(row) for row in rows]
 
+    def list_overdue_plans(self, plan_type: str, today: str) -> list[dict[str, Any]]:
+        """List unfinished plans of a type whose due date is before `today` (YYYY-MM-DD)."""
+        with self.engine.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT * FROM plans
+                WHERE type = ? AND COALESCE(status, '') NOT IN ('done', 'completed')
+                  AND due_date != '' AND due_date < ?
+                ORDER BY priority DESC, due_date
+                """,
+                (plan_type, today),
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    def list_stalled_plans(self, plan_type: str, cutoff: str) -> list[dict[str, Any]]:
+        """List unfinished plans of a type created before `cutoff` (ISO timestamp)."""
+        with self.engine.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT * FROM plans
+                WHERE type = ? AND COALESCE(status, '') NOT IN ('done', 'completed')
+                  AND created_at < ?
+                ORDER BY priority DESC, due_date
+                """,
+                (plan_type, cutoff),
+            ).fetchall()
+            return [dict(row) for row in rows]
+
     def update_plan_status(self, plan_id: str, status: str) -> bool:
         """Update plan status."""
         with self.engine.connection() as conn:
@@ -315,6 +347,27 @@ class StrategicStore:
                 (wisdom_id, origin_node, category, signal_pattern, wisdom_text, confidence),
             )
 
+    def save_public_wisdom_batch(self, entries: List[Dict[str, Any]]) -> None:
+        """Save many wisdom entries (save_public_wisdom kwargs) in one transaction."""
+        rows = [
+            (e["wisdom_id"], e.get("origin_node"), e.get("category"), e.get("signal_pattern"),
+             e["wisdom_text"], e.get("confidence", 5))
+            for e in entries
+        ]
+        if not rows:
+            return
+        with self.engine.connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO public_wisdom (id, origin_node, category, signal_pattern, wisdom_text, confidence)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    wisdom_text = excluded.wisdom_text,
+                    confidence = excluded.confidence
+                """,
+                rows,
+            )
+
     def list_public_wisdom(self, signal_pattern: str | None = None) -> List[Dict[str, Any]]:
         """Retrieve public wisdom, optionally filtered by architectural signal."""
         with self.engine.connection() as conn:
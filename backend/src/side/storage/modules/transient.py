@@ -2,20 +2,51 @@
 Sovereign Operational Store - Cache, Metadata, & System Stats.
 """
 
-import json
 import logging
 import hashlib
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
-from .base import SovereignEngine
+from .base import SovereignEngine, SQL_NOW_US, TTL_SWEEP_LIMIT, epoch_us, json_dumpb, json_dumps, json_loads, pack_json, unpack_json
 
 logger = logging.getLogger(__name__)
 
+# Hot-path statements, hoisted so every call hits the same prepared statement
+_SQL_SAVE_QUERY_CACHE = """
+    INSERT INTO query_cache (query_hash, query_type, result, expires_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(query_hash) DO UPDATE SET
+        result = excluded.result,
+        cached_at = CURRENT_TIMESTAMP,
+        expires_at = excluded.expires_at
+"""
+_SQL_GET_QUERY_CACHE = "SELECT query_type, result, expires_at FROM query_cache WHERE query_hash = ? AND expires_at > ?"
+
+_STATS_TABLES = ("profile", "plans", "decisions", "learnings", "work_context", "query_cache", "activities", "audits")
+# Every row count in one statement instead of one round-trip per table
+_SQL_TABLE_COUNTS = " UNION ALL ".join(
+    f"SELECT '{table}_count', COUNT(*) FROM {table}" for table in _STATS_TABLES
+)
+
 class OperationalStore:
+    # In-process front for the query cache. Entries live at most MEMO_TTL_SECONDS
+    # so writes from other processes sharing the DB are picked up within a minute.
+    MEMO_TTL_SECONDS = 60
+    MEMO_MAX_ENTRIES = 256
+
     def __init__(self, engine: SovereignEngine):
         self.engine = engine
+        # query_hash -> (monotonic deadline, query_type, result JSON text)
+        # Guarded by _memo_lock: stores are called from to_thread workers too
+        self._memo: OrderedDict[str, tuple[float, str, str]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # Bumped by invalidation; a read or write that started under an older
+        # generation must not memoize what it saw
+        self._memo_generation = 0
 
     def init_schema(self, conn):
         """Initialize operational tables."""
@@ -53,10 +84,25 @@ class OperationalStore:
                 query_type TEXT NOT NULL,
                 result JSON NOT NULL,
                 cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                expires_at TIMESTAMP NOT NULL
+                expires_at INTEGER NOT NULL
             )
         """)
         conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_expires ON query_cache(expires_at)")
+        # Per-type invalidation (and per-type expiry checks) seek instead of scanning
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_query_cache_type_expires ON query_cache(query_type, expires_at)"
+        )
+        # Incremental TTL: each insert sweeps a bounded batch of older expired rows
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_query_cache_ttl AFTER INSERT ON query_cache
+            BEGIN
+                DELETE FROM query_cache WHERE rowid IN (
+                    SELECT rowid FROM query_cache
+                    WHERE expires_at < {SQL_NOW_US} AND rowid != NEW.rowid
+                    LIMIT {TTL_SWEEP_LIMIT}
+                );
+            END
+        """)
 
         # ─────────────────────────────────────────────────────────────
         # OPERATIONAL TABLE: TELEMETRY_ALERTS (THE PROACTIVE OBSERVER)
@@ -107,37 +153,92 @@ class OperationalStore:
                 (key, str(value))
             )
 
+    @staticmethod
+    def compute_cache_key(query_type: str, query_params: dict[str, Any]) -> str:
+        """
+        Cache key for a query: a 64-bit BLAKE2b digest (a lookup key, not a security boundary).
+
+        Callers with constant params can compute this once and use the *_by_key methods.
+        """
+        # Stream the pieces into the digest rather than building a joined key string
+        digest = hashlib.blake2b(query_type.encode(), digest_size=8)
+        digest.update(b":")
+        digest.update(json_dumpb(query_params, sort_keys=True))
+        return digest.hexdigest()
+
     def save_query_cache(self, query_type: str, query_params: dict[str, Any], 
                          result: Any, ttl_hours: int = 1) -> None:
         """Cache query result."""
-        query_str = f"{query_type}:{json.dumps(query_params, sort_keys=True)}"
-        query_hash = hashlib.sha256(query_str.encode()).hexdigest()[:16]
+        self.save_query_cache_by_key(
+            self.compute_cache_key(query_type, query_params), query_type, result, ttl_hours
+        )
+
+    def save_query_cache_by_key(self, query_hash: str, query_type: str,
+                                result: Any, ttl_hours: int = 1) -> None:
+        """Cache query result under a key from compute_cache_key."""
+        generation = self._memo_generation
         expires_at = datetime.now(timezone.utc) + timedelta(hours=ttl_hours)
 
+        result_json = json_dumps(result)
+        expires_us = epoch_us(expires_at)
+
         with self.engine.connection() as conn:
             conn.execute(
-                """
-                INSERT INTO query_cache (query_hash, query_type, result, expires_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(query_hash) DO UPDATE SET
-                    result = excluded.result,
-                    cached_at = CURRENT_TIMESTAMP,
-                    expires_at = excluded.expires_at
-                """,
-                (query_hash, query_type, json.dumps(result), expires_at.isoformat()),
+                _SQL_SAVE_QUERY_CACHE,
+                (query_hash, query_type, pack_json(result_json), expires_us),
             )
+        self._remember(query_hash, query_type, result_json, expires_us, generation)
 
     def get_query_cache(self, query_type: str, query_params: dict[str, Any]) -> Any | None:
         """Get cached query result."""
-        query_str = f"{query_type}:{json.dumps(query_params, sort_keys=True)}"
-        query_hash = hashlib.sha256(query_str.encode()).hexdigest()[:16]
+        return self.get_query_cache_by_key(self.compute_cache_key(query_type, query_params))
 
+    def get_query_cache_by_key(self, query_hash: str) -> Any | None:
+        """Get cached query result by a key from compute_cache_key."""
+        with self._memo_lock:
+            hit = self._memo.get(query_hash)
+            if hit is not None:
+                if hit[0] > time.monotonic():
+                    # Mark as most recent so eviction drops the least recently used
+                    self._memo.move_to_end(query_hash)
+                else:
+                    del self._memo[query_hash]
+                    hit = None
+        if hit is not None:
+            # Decode per hit (outside the lock) so callers never share a mutable result
+            return json_loads(hit[2])
+
+        generation = self._memo_generation
         with self.engine.connection() as conn:
             row = conn.execute(
-                "SELECT result FROM query_cache WHERE query_hash = ? AND expires_at > ?",
-                (query_hash, datetime.now(timezone.utc).isoformat()),
+                _SQL_GET_QUERY_CACHE,
+                (query_hash, epoch_us()),
             ).fetchone()
-            return json.loads(row["result"]) if row else None
+        if row is None:
+            return None
+        result_json = unpack_json(row["result"])
+        self._remember(query_hash, row["query_type"], result_json, row["expires_at"], generation)
+        return json_loads(result_json)
+
+    def _remember(self, query_hash: str, query_type: str, result_json: str, expires_us: int,
+                  generation: int) -> None:
+        """
+        Memoize a cache row until its own expiry or MEMO_TTL_SECONDS, whichever is sooner.
+
+        Skipped if an invalidation ran since `generation` was read, since the row may be gone.
+        """
+        ttl = min(self.MEMO_TTL_SECONDS, (expires_us - epoch_us()) / 1_000_000)
+        if ttl <= 0:
+            return
+        entry = (time.monotonic() + ttl, query_type, result_json)
+        with self._memo_lock:
+            if generation != self._memo_generation:
+                return
+            self._memo.pop(query_hash, None)
+            while len(self._memo) >= self.MEMO_MAX_ENTRIES:
+                # Evict the least recently used entry
+                self._memo.popitem(last=False)
+            self._memo[query_hash] = entry
 
     def invalidate_query_cache(self, query_type: str | None = None) -> int:
         """Invalidate query cache."""
@@ -146,19 +247,40 @@ class OperationalStore:
                 cursor = conn.execute("DELETE FROM query_cache WHERE query_type = ?", (query_type,))
             else:
                 cursor = conn.execute("DELETE FROM query_cache")
+        # Only after the delete: a reader that fetched the row before it must not
+        # re-memoize it, so drop entries and fence off in-flight reads together
+        with self._memo_lock:
+            self._memo_generation += 1
+            if query_type:
+                for key in [k for k, v in self._memo.items() if v[1] == query_type]:
+                    del self._memo[key]
+            else:
+                self._memo.clear()
+        return cursor.rowcount
+
+    def cleanup_expired_cache(self) -> int:
+        """Delete expired query cache rows."""
+        with self.engine.connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM query_cache WHERE expires_at < ?",
+                (epoch_us(),),
+            )
             return cursor.rowcount
 
     def get_database_stats(self, db_path: Path) -> dict[str, Any]:
         """Get database statistics."""
         with self.engine.connection() as conn:
-            stats = {}
-            tables = ["profile", "plans", "decisions", "learnings", "work_context", "query_cache", "activities", "audits"]
-            for table in tables:
-                try:
-                    row = conn.execute(f"SELECT COUNT(*) as count FROM {table}").fetchone()
-                    stats[f"{table}_count"] = row["count"] if row else 0
-                except sqlite3.OperationalError:
-                    stats[f"{table}_count"] = 0
+            try:
+                stats: dict[str, Any] = dict(conn.execute(_SQL_TABLE_COUNTS).fetchall())
+            except sqlite3.OperationalError:
+                # A table is missing (older schema): count what is there one by one
+                stats = {}
+                for table in _STATS_TABLES:
+                    try:
+                        row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+                        stats[f"{table}_count"] = row[0]
+                    except sqlite3.OperationalError:
+                        stats[f"{table}_count"] = 0
 
             stats["db_size_bytes"] = db_path.stat().st_size if db_path.exists() else 0
             stats["db_size_mb"] = stats["db_size_bytes"] / (1024 * 1024)
@@ -10,6 +10,7 @@ This is a modular facade that delegates to specialized domain stores:
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from side.utils.helpers import safe_get
@@ -22,6 +23,9 @@ from .modules.transient import OperationalStore
 
 logger = logging.getLogger(__name__)
 
+# Cleanup refreshes full planner statistics at most this often
+ANALYZE_INTERVAL_SECONDS = 3600
+
 # Re-export for compatibility
 InsufficientTokensError = InsufficientTokensError
 
@@ -39,6 +43,7 @@ class SimplifiedDatabase:
         self.strategic = StrategicStore(self.engine)
         self.forensic = ForensicStore(self.engine)
         self.operational = OperationalStore(self.engine)
+        self._last_analyze = 0.0
 
         # Startup lifecycle
         self.engine.atomic_backup()
@@ -58,8 +63,38 @@ class SimplifiedDatabase:
         """Handle CTO-level schema resilience."""
         version = self.operational.get_version()
         # [Handover Note] Add version-based migrations here via self.operational.set_version()
+        if version < 1.1:
+            self._migrate_epoch_expiry()
+            version = 1.1
+            self.operational.set_version(version)
+        if version < 1.2:
+            self._migrate_incremental_vacuum()
+            version = 1.2
+            self.operational.set_version(version)
         logger.info(f"Sidelith Sovereign Schema: v{version}")
 
+    def _migrate_epoch_expiry(self) -> None:
+        """v1.1: ISO-8601 expires_at strings -> INTEGER unix microseconds."""
+        with self.engine.connection() as conn:
+            for table in ("query_cache", "work_context"):
+                conn.execute(
+                    f"UPDATE {table} SET expires_at = "
+                    "CAST((julianday(expires_at) - 2440587.5) * 86400000000 AS INTEGER) "
+                    "WHERE typeof(expires_at) = 'text'"
+                )
+                # TTL triggers created against the string format are rebuilt below
+                conn.execute(f"DROP TRIGGER IF EXISTS trg_{table}_ttl")
+        self._init_schema()
+
+    def _migrate_incremental_vacuum(self) -> None:
+        """v1.2: rebuild files created before auto_vacuum=INCREMENTAL so cleanup can shrink them."""
+        with self.engine.connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return
+            # The mode only sticks on an existing file after a full VACUUM
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.executescript("VACUUM;")
+
     def _connection(self):
         """Legacy compatibility for internal tools."""
         return self.engine.connection()
@@ -118,8 +153,9 @@ class SimplifiedDatabase:
     def get_plan(self, plan_id: str) -> dict[str, Any] | None:
         return self.strategic.get_plan(plan_id)
 
-    def list_plans(self, project_id: str | None = None, plan_type: str | None = None, status: str | None = None) -> list[dict[str, Any]]:
-        return self.strategic.list_plans(project_id, plan_type, status)
+    def list_plans(self, project_id: str | None = None, plan_type: str | None = None, status: str | None = None,
+                   limit: int | None = None) -> list[dict[str, Any]]:
+        return self.strategic.list_plans(project_id, plan_type, status, limit)
 
     def update_plan_status(self, plan_id: str, status: str) -> bool:
         return self.strategic.update_plan_status(plan_id, status)
@@ -174,14 +210,12 @@ class SimplifiedDatabase:
     def get_overdue_goals(self) -> list[dict[str, Any]]:
         from datetime import datetime, timezone
         today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        return [p for p in self.strategic.list_plans(plan_type="goal") 
-                if p["status"] not in ("done", "completed") and p["due_date"] and p["due_date"] < today]
+        return self.strategic.list_overdue_plans("goal", today)
 
     def get_stalled_goals(self, days: int = 3) -> list[dict[str, Any]]:
         from datetime import datetime, timezone, timedelta
         cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-        return [p for p in self.strategic.list_plans(plan_type="goal") 
-                if p["status"] not in ("done", "completed") and p["created_at"] < cutoff]
+        return self.strategic.list_stalled_plans("goal", cutoff)
 
     def update_goal_activity(self, goal_id: str) -> bool:
         # Compatibility touch
@@ -215,7 +249,21 @@ class SimplifiedDatabase:
         return self.forensic.get_latest_work_context(project_path)
 
     def cleanup_expired_data(self) -> dict[str, int]:
-        return self.forensic.cleanup_expired_data()
+        # All deletes share one transaction (one WAL commit), then let SQLite
+        # refresh planner stats for the tables that just shrank
+        with self.engine.connection():
+            deleted = self.forensic.cleanup_expired_data()
+            deleted["query_cache"] = self.operational.cleanup_expired_cache()
+        with self.engine.connection() as conn:
+            # execute() steps a statement once, and incremental_vacuum frees one
+            # page per step; executescript runs it to completion
+            conn.executescript("PRAGMA incremental_vacuum(512);")
+            if time.monotonic() - self._last_analyze >= ANALYZE_INTERVAL_SECONDS:
+                conn.execute("ANALYZE")
+                self._last_analyze = time.monotonic()
+            else:
+                conn.execute("PRAGMA optimize")
+        return deleted
 
     def prune_activities(self, days: int = 30) -> int:
         return self.forensic.prune_activities(days)
@@ -228,6 +276,16 @@ class SimplifiedDatabase:
     def get_query_cache(self, query_type: str, query_params: dict[str, Any]) -> Any | None:
         return self.operational.get_query_cache(query_type, query_params)
 
+    def compute_cache_key(self, query_type: str, query_params: dict[str, Any]) -> str:
+        return self.operational.compute_cache_key(query_type, query_params)
+
+    def save_query_cache_by_key(self, query_hash: str, query_type: str,
+                                result: Any, ttl_hours: int = 1) -> None:
+        return self.operational.save_query_cache_by_key(query_hash, query_type, result, ttl_hours)
+
+    def get_query_cache_by_key(self, query_hash: str) -> Any | None:
+        return self.operational.get_query_cache_by_key(query_hash)
+
     def invalidate_query_cache(self, query_type: str | None = None) -> int:
         return self.operational.invalidate_query_cache(query_type)
 
@@ -264,6 +322,9 @@ class SimplifiedDatabase:
                            confidence: int = 5) -> None:
         return self.strategic.save_public_wisdom(wisdom_id, wisdom_text, origin_node, category, signal_pattern, confidence)
 
+    def save_public_wisdom_batch(self, entries: List[Dict[str, Any]]) -> None:
+        return self.strategic.save_public_wisdom_batch(entries)
+
     def list_public_wisdom(self, signal_pattern: str | None = None) -> List[Dict[str, Any]]:
         return self.strategic.list_public_wisdom(signal_pattern)
 
@@ -2,7 +2,7 @@ import os
 import logging
 from pathlib import Path
 from typing import List, Dict, Any
-from side.tools.recursive_utils import partition, peek, grep, chunk_list
+from side.tools.recursive_utils import partition, peek, peek_file, grep, chunk_list
 from side.intel.memory import MemoryPersistence, MemoryManager
 from side.llm.client import LLMClient
 
@@ -18,6 +18,10 @@ class ForensicsTool:
     4. Recursively analyze.
     """
 
+    # Standard excludes
+    EXCLUDED_DIRS = frozenset({'.git', 'node_modules', '__pycache__', 'venv', 'env', '.DS_Store'})
+    SOURCE_SUFFIXES = ('.py', '.js', '.ts', '.tsx', '.go', '.rs', '.md')
+
     def __init__(self, project_path: Path):
         self.project_path = project_path
         self.llm = LLMClient()
@@ -47,15 +51,16 @@ class ForensicsTool:
             result = subprocess.run(
                 cmd, 
                 capture_output=True, 
-                text=True, 
                 timeout=5
             )
             if result.returncode == 0:
                 found_files = []
-                for line in result.stdout.strip().splitlines():
+                allowed = set(all_files)
+                # grep prints raw path bytes; split first, decode each path the way the OS does
+                for line in result.stdout.split(b"\n"):
                     if line:
-                        path = Path(line)
-                        if path in all_files: # Only include if it passed the base filter
+                        path = Path(os.fsdecode(line))
+                        if path in allowed: # Only include if it passed the base filter
                             found_files.append(path)
                 
                 if found_files:
@@ -80,9 +85,8 @@ class ForensicsTool:
             chunk_content = ""
             for file_path in chunk:
                 try:
-                    content = file_path.read_text(errors='ignore')
-                    # Peek only first 500 lines to save tokens
-                    preview = peek(content, lines=500) 
+                    # Peek only first 500 lines to save tokens (streamed, not read whole)
+                    preview = peek_file(file_path, lines=500)
                     chunk_content += f"\n--- File: {file_path.relative_to(self.project_path)} ---\n{preview}\n"
                 except Exception:
                     continue
@@ -98,13 +102,11 @@ class ForensicsTool:
 
     def _find_files(self, patterns: List[str] = None) -> List[Path]:
         """Return a list of source code files."""
-        # Standard excludes
-        excludes = {'.git', 'node_modules', '__pycache__', 'venv', 'env', '.DS_Store'}
         files = []
         for root, dirs, filenames in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in excludes]
+            dirs[:] = [d for d in dirs if d not in self.EXCLUDED_DIRS]
             for name in filenames:
-                if name.endswith(('.py', '.js', '.ts', '.tsx', '.go', '.rs', '.md')):
+                if name.endswith(self.SOURCE_SUFFIXES):
                     files.append(Path(root) / name)
         return files
 
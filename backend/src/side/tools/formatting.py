@@ -109,40 +109,56 @@ def box_separator() -> str:
 # CONFIDENCE & PROGRESS BARS
 # ============================================================================
 
-def confidence_bar(score: int, max_score: int = 100, width: int = 20) -> str:
+_BAR_WIDTH = 20
+# Every fill level of a default-width bar, built once instead of per render
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+
+def _bar(filled: int, width: int) -> str:
+    """Bar string with `filled` of `width` cells filled."""
+    if width == _BAR_WIDTH and 0 <= filled <= width:
+        return _BARS[filled]
+    return "█" * filled + "░" * (width - filled)
+
+
+def confidence_bar(score: int, max_score: int = 100, width: int = _BAR_WIDTH) -> str:
     """Create a visual confidence bar.
     
     Example: ████████████░░░░░░░░  87% confidence
     """
     ratio = min(score / max_score, 1.0)
-    filled = int(ratio * width)
-    empty = width - filled
-    bar = "█" * filled + "░" * empty
+    bar = _bar(int(ratio * width), width)
     return f"{bar}  {int(ratio * 100)}% confidence"
 
 
-def progress_bar(done: int, total: int, width: int = 20) -> str:
+def progress_bar(done: int, total: int, width: int = _BAR_WIDTH) -> str:
     """Create a visual progress bar.
     
     Example: ████████████░░░░░░░░  60% (6/10)
     """
     ratio = done / total if total > 0 else 0
-    filled = int(ratio * width)
-    empty = width - filled
-    bar = "█" * filled + "░" * empty
+    bar = _bar(int(ratio * width), width)
     return f"{bar}  {int(ratio * 100)}% ({done}/{total})"
 
 
+# (minimum percentage, grade, label), highest first (consistent with audit system)
+_IQ_GRADES = (
+    (90, "A", "Production Ready"),
+    (80, "B", "Needs Polish"),
+    (70, "C", "MVP Quality"),
+    (60, "D", "Significant Issues"),
+)
+_IQ_FAIL = ("F", "Critical Fixes Needed")
+
+
 def strategic_iq_display(score: int, max_score: int = 160) -> str:
     """Create the Strategic IQ display with a central School Grade."""
     percentage = min(int((score / max_score) * 100), 100)
     
-    # Simple A-F Scale (consistent with audit system)
-    if percentage >= 90: grade, label = "A", "Production Ready"
-    elif percentage >= 80: grade, label = "B", "Needs Polish"
-    elif percentage >= 70: grade, label = "C", "MVP Quality"
-    elif percentage >= 60: grade, label = "D", "Significant Issues"
-    else: grade, label = "F", "Critical Fixes Needed"
+    # Simple A-F Scale
+    grade, label = next(
+        ((g, lbl) for threshold, g, lbl in _IQ_GRADES if percentage >= threshold), _IQ_FAIL
+    )
     
     return f"""        GRADE: {grade} ({label})
         SCORE: {score}/{max_score}
@@ -176,15 +192,15 @@ def format_decision(
     Returns:
         Beautifully formatted decision
     """
-    output = box_header("💎", "DECISION", "128 Tokens")
-    output += box_empty()
-    output += box_line(f"VERDICT: {verdict}")
-    output += box_line(confidence_bar(confidence))
-    output += box_empty()
+    parts = [box_header("💎", "DECISION", "128 Tokens")]
+    parts.append(box_empty())
+    parts.append(box_line(f"VERDICT: {verdict}"))
+    parts.append(box_line(confidence_bar(confidence)))
+    parts.append(box_empty())
     
     # Add comparison table if provided
     if comparison:
-        output += box_line("┌" + "─" * 35 + "┐")
+        parts.append(box_line("┌" + "─" * 35 + "┐"))
         headers = list(comparison.keys())
         metrics = list(comparison[headers[0]].keys()) if headers else []
         
@@ -192,8 +208,8 @@ def format_decision(
         header_row = f"│ {'':9} │"
         for h in headers[:2]:
             header_row += f" {h:10} │"
-        output += box_line(header_row)
-        output += box_line("├" + "─" * 35 + "┤")
+        parts.append(box_line(header_row))
+        parts.append(box_line("├" + "─" * 35 + "┤"))
         
         # Data rows
         for metric in metrics:
@@ -201,31 +217,35 @@ def format_decision(
             for h in headers[:2]:
                 val = comparison[h].get(metric, "")
                 row += f" {str(val):10} │"
-            output += box_line(row)
+            parts.append(box_line(row))
         
-        output += box_line("└" + "─" * 35 + "┘")
-        output += box_empty()
+        parts.append(box_line("└" + "─" * 35 + "┘"))
+        parts.append(box_empty())
     
     # Personalized context
     if context:
-        output += box_line(f"Your project: {context}")
-        output += box_empty()
+        parts.append(box_line(f"Your project: {context}"))
+        parts.append(box_empty())
     
     # Reasoning (brief)
     for line in reasoning.split("\n")[:2]:
-        output += box_line(f"→ {line.strip()}")
+        parts.append(box_line(f"→ {line.strip()}"))
     
-    output += box_empty()
-    output += box_line("📎 Decision saved to strategic_ledger.md")
-    output += box_footer(follow_up)
+    parts.append(box_empty())
+    parts.append(box_line("📎 Decision saved to strategic_ledger.md"))
+    parts.append(box_footer(follow_up))
     
-    return output
+    return "".join(parts)
 
 
 # ============================================================================
 # STRATEGY FORMATTING (for `strategy` tool)
 # ============================================================================
 
+# (minimum dimension score, status icon), highest first
+_DIMENSION_STATUS = ((30, "✅"), (25, "💡"), (20, "⚠️"))
+
+
 def format_strategy(
     question: str,
     iq_display: str,
@@ -246,40 +266,40 @@ def format_strategy(
         elapsed: Response time
         follow_up: Next step prompt
     """
-    output = box_header("📊", "STRATEGIC IQ", "256 Tokens")
-    output += box_empty()
-    output += box_line(f"INQUIRY: {question[:60]}...")
-    output += box_empty()
-    output += box_line(iq_display)
-    output += box_empty()
+    parts = [box_header("📊", "STRATEGIC IQ", "256 Tokens")]
+    parts.append(box_empty())
+    parts.append(box_line(f"INQUIRY: {question[:60]}..."))
+    parts.append(box_empty())
+    parts.append(box_line(iq_display))
+    parts.append(box_empty())
     
     # Dimension breakdown
-    output += box_line("┌─────────────┬──────┬────────┐")
+    parts.append(box_line("┌─────────────┬──────┬────────┐"))
     header_row = "│ Dimension   │ Score│ Status │"
-    output += box_line(header_row)
-    output += box_line("├─────────────┼──────┼────────┤")
+    parts.append(box_line(header_row))
+    parts.append(box_line("├─────────────┼──────┼────────┤"))
     
     for dim, score in dimensions.items():
-        status = "✅" if score >= 30 else "💡" if score >= 25 else "⚠️" if score >= 20 else "🔴"
-        output += box_line(f"│ {dim:11} │  {score:2}  │   {status}   │")
+        status = next((icon for threshold, icon in _DIMENSION_STATUS if score >= threshold), "🔴")
+        parts.append(box_line(f"│ {dim:11} │  {score:2}  │   {status}   │"))
     
-    output += box_line("└─────────────┴──────┴────────┘")
-    output += box_empty()
-    output += box_line(f"TOP FOCUS: {top_focus}")
+    parts.append(box_line("└─────────────┴──────┴────────┘"))
+    parts.append(box_empty())
+    parts.append(box_line(f"TOP FOCUS: {top_focus}"))
     
     # LLM Strategic Context (The Vibe)
     if llm_context:
-        output += box_empty()
-        output += box_line("⚡ THE STRATEGIC VIBE:")
+        parts.append(box_empty())
+        parts.append(box_line("⚡ THE STRATEGIC VIBE:"))
         for line in llm_context.split("\n")[:3]:
-            output += box_line(f"  {line.strip()}")
+            parts.append(box_line(f"  {line.strip()}"))
     
-    output += box_line("📎 Strategy saved to strategic_ledger.md")
+    parts.append(box_line("📎 Strategy saved to strategic_ledger.md"))
     if elapsed > 0:
-        output += box_line(f"⚡ Response time: {elapsed*1000:.0f}ms")
-    output += box_footer(follow_up)
+        parts.append(box_line(f"⚡ Response time: {elapsed*1000:.0f}ms"))
+    parts.append(box_footer(follow_up))
     
-    return output
+    return "".join(parts)
 
 
 # ============================================================================
@@ -304,27 +324,27 @@ def format_simulation(
         would_pay: Price or churn prediction
         follow_up: The follow-up hook
     """
-    output = box_header("🎭", persona_name, "64 Tokens")
-    output += box_line(f'"{persona_quote}"')
-    output += box_separator()
-    output += box_empty()
+    parts = [box_header("🎭", persona_name, "64 Tokens")]
+    parts.append(box_line(f'"{persona_quote}"'))
+    parts.append(box_separator())
+    parts.append(box_empty())
     
     # Reaction with emoji scale
     emoji = "😠" if satisfaction < 4 else "😐" if satisfaction < 6 else "😊" if satisfaction < 8 else "🤩"
-    output += box_line(f"REACTION: {emoji} {'Frustrated' if satisfaction < 4 else 'Neutral' if satisfaction < 6 else 'Satisfied' if satisfaction < 8 else 'Delighted'} ({satisfaction}/10)")
-    output += box_empty()
+    parts.append(box_line(f"REACTION: {emoji} {'Frustrated' if satisfaction < 4 else 'Neutral' if satisfaction < 6 else 'Satisfied' if satisfaction < 8 else 'Delighted'} ({satisfaction}/10)"))
+    parts.append(box_empty())
     
     # Pain points
-    output += box_line("PAIN POINTS:")
+    parts.append(box_line("PAIN POINTS:"))
     for i, pain in enumerate(pain_points[:3], 1):
-        output += box_line(f'  {i}. "{pain}"')
-    output += box_empty()
+        parts.append(box_line(f'  {i}. "{pain}"'))
+    parts.append(box_empty())
     
     # Business impact
-    output += box_line(f"WOULD PAY: {would_pay}")
-    output += box_footer(follow_up)
+    parts.append(box_line(f"WOULD PAY: {would_pay}"))
+    parts.append(box_footer(follow_up))
     
-    return output
+    return "".join(parts)
 
 
 # ============================================================================
@@ -345,23 +365,23 @@ def format_audit_summary(
     if follow_ups is None:
         follow_ups = ["Show all findings?", "Fix critical issues first?", "Export to plan.md?"]
     
-    output = box_header("🔍", "AUDIT COMPLETE", "512 Tokens")
-    output += box_empty()
+    parts = [box_header("🔍", "AUDIT COMPLETE", "512 Tokens")]
+    parts.append(box_empty())
     
     # Magnitude display (color-coded in concept)
     severity_line = f"{critical} CRITICAL • {high} HIGH • {medium} MEDIUM"
-    output += box_line(severity_line)
-    output += box_empty()
-    output += box_line(f"TOP ISSUE: {top_issue}")
-    output += box_empty()
+    parts.append(box_line(severity_line))
+    parts.append(box_empty())
+    parts.append(box_line(f"TOP ISSUE: {top_issue}"))
+    parts.append(box_empty())
     
     # Follow-up options
     for hook in follow_ups[:3]:
-        output += box_line(f"▸ {hook}")
+        parts.append(box_line(f"▸ {hook}"))
     
-    output += box_footer()
+    parts.append(box_footer())
     
-    return output
+    return "".join(parts)
 
 
 def format_audit_finding(
@@ -376,23 +396,23 @@ def format_audit_finding(
     """Format a single forensic finding with code diff."""
     emoji = "🚨" if severity == "CRITICAL" else "⚠️" if severity == "HIGH" else "📋"
     
-    output = box_header(emoji, f"{severity} FINDING", "")
-    output += box_empty()
-    output += box_line(f"{finding_type} in {file_path}")
-    output += box_empty()
+    parts = [box_header(emoji, f"{severity} FINDING", "")]
+    parts.append(box_empty())
+    parts.append(box_line(f"{finding_type} in {file_path}"))
+    parts.append(box_empty())
     
     # Code snippet
-    output += box_line("┌" + "─" * 40 + "┐")
+    parts.append(box_line("┌" + "─" * 40 + "┐"))
     for line in code_snippet.split("\n")[:4]:
-        output += box_line(f"│ {line[:38]:38} │")
-    output += box_line("└" + "─" * 40 + "┘")
-    output += box_empty()
+        parts.append(box_line(f"│ {line[:38]:38} │"))
+    parts.append(box_line("└" + "─" * 40 + "┘"))
+    parts.append(box_empty())
     
-    output += box_line(f"RISK: {risk}")
-    output += box_line(f"FIX:  {fix}")
-    output += box_footer(follow_up)
+    parts.append(box_line(f"RISK: {risk}"))
+    parts.append(box_line(f"FIX:  {fix}"))
+    parts.append(box_footer(follow_up))
     
-    return output
+    return "".join(parts)
 
 
 # ============================================================================
@@ -407,8 +427,8 @@ def format_plan(goals: list[dict], follow_up: str = "Break down Week 1 into task
                box_line('▸ Try: plan "Launch MVP by end of month"') + \
                box_footer()
     
-    output = box_header("📋", "90-DAY STRATEGIC PLAN", "128 Tokens")
-    output += box_empty()
+    parts = [box_header("📋", "90-DAY STRATEGIC PLAN", "128 Tokens")]
+    parts.append(box_empty())
     
     # Group goals
     objectives = [g for g in goals if g.get('type') == 'objective']
@@ -419,30 +439,30 @@ def format_plan(goals: list[dict], follow_up: str = "Break down Week 1 into task
     all_items = objectives + milestones + regular_goals + tasks
     
     # Visual OKR display
-    output += box_line("┌" + "─" * 40 + "┐")
-    output += box_line("│ STRATEGIC OKRS" + " " * 24 + "│")
-    output += box_line("├" + "─" * 40 + "┤")
+    parts.append(box_line("┌" + "─" * 40 + "┐"))
+    parts.append(box_line("│ STRATEGIC OKRS" + " " * 24 + "│"))
+    parts.append(box_line("├" + "─" * 40 + "┤"))
     
     for i, g in enumerate(all_items[:5]):
         status = "✅" if g.get('status') in ['done', 'completed'] else "⬜"
         title = g.get('title', '')[:35]
-        output += box_line(f"│ {status} {title:36} │")
+        parts.append(box_line(f"│ {status} {title:36} │"))
     
     if len(all_items) > 5:
-        output += box_line(f"│   +{len(all_items) - 5} more items...               │")
+        parts.append(box_line(f"│   +{len(all_items) - 5} more items...               │"))
     
-    output += box_line("└" + "─" * 40 + "┘")
-    output += box_empty()
+    parts.append(box_line("└" + "─" * 40 + "┘"))
+    parts.append(box_empty())
     
     # Progress
     total = len(goals)
     done = len([g for g in goals if g.get('status') in ['done', 'completed']])
-    output += box_line(progress_bar(done, total))
-    output += box_empty()
-    output += box_line("📎 Full plan.md saved")
-    output += box_footer(follow_up)
+    parts.append(box_line(progress_bar(done, total)))
+    parts.append(box_empty())
+    parts.append(box_line("📎 Full plan.md saved"))
+    parts.append(box_footer(follow_up))
     
-    return output
+    return "".join(parts)
 
 
 # ============================================================================
@@ -5,6 +5,8 @@ These tools allow the agent to "program" its interaction with large contexts,
 breaking them down rather than trying to swallow them whole.
 """
 import re
+from itertools import islice
+from pathlib import Path
 from typing import List, Generator, Any
 
 def peek(text: str, lines: int = 50) -> str:
@@ -18,6 +20,17 @@ def peek(text: str, lines: int = 50) -> str:
     content = "\n".join(all_lines[:lines])
     return header + content
 
+def peek_file(path: Path, lines: int = 50) -> str:
+    """
+    Same view as `peek`, but streamed from disk: only the first N lines are
+    held in memory; the rest are counted and discarded.
+    """
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        head = [line.rstrip("\r\n") for line in islice(f, lines)]
+        total = len(head) + sum(1 for _ in f)
+    header = f"--- PEEK (First {lines} of {total} lines) ---\n"
+    return header + "\n".join(head)
+
 def grep(pattern: str, text: str, context: int = 0) -> str:
     """
     Filter lines matching a regex pattern.
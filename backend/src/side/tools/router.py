@@ -4,13 +4,16 @@ Tool router for Side.
 Routes incoming tool calls to appropriate handler modules.
 """
 
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from side.tools.strategy import handle_decide, handle_strategy
 from side.tools.planning import handle_plan, handle_check
 from side.tools.audit import handle_run_audit
 from side.tools.welcome import handle_welcome
+from side.tools.verification import VerificationTool
 from side.storage.simple_db import SimplifiedDatabase, InsufficientTokensError
 from side.tools.core import get_database
 
@@ -26,32 +29,37 @@ TOOL_COSTS = {
     "welcome": 0,
 }
 
+# Name -> handler, built once at import; read-only so dispatch can't drift at runtime
+TOOL_HANDLERS = MappingProxyType({
+    "architectural_decision": handle_decide,
+    "strategic_review": handle_strategy,
+    "plan": handle_plan,
+    "check": handle_check,
+    "run_audit": handle_run_audit,
+    "welcome": handle_welcome,
+})
+
+
+def _charge(db: SimplifiedDatabase, project_id: str, name: str, cost: int) -> None:
+    """Debit a tool run and record it (one thread hop for both writes)."""
+    db.update_token_balance(project_id, -cost)
+    db.log_activity(project_id, name, "execution", cost)
+
 
 async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
     """Route tool calls to appropriate handlers."""
-    handlers = {
-        "architectural_decision": handle_decide,
-        "strategic_review": handle_strategy,
-        "plan": handle_plan,
-        "check": handle_check,
-        "run_audit": handle_run_audit,
-        "welcome": handle_welcome,
-    }
-
     if name == "verify_fix":
-        from side.tools.verification import VerificationTool
         tool = VerificationTool()
         result = await tool.run(arguments)
         return result.content
         
     if name == "generate_repro":
-        from side.tools.verification import VerificationTool
         tool = VerificationTool()
         result = await tool.generate_repro(arguments)
         return result.content
 
 
-    handler = handlers.get(name)
+    handler = TOOL_HANDLERS.get(name)
     if handler is None:
         return f"❌ Unknown tool: {name}"
 
@@ -65,7 +73,8 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
     
     # 3. Verify balance before execution
     if cost > 0:
-        balance_info = db.get_token_balance(project_id)
+        # SQLite calls are blocking; keep them off the event loop
+        balance_info = await asyncio.to_thread(db.get_token_balance, project_id)
         if balance_info["balance"] < cost:
             return f"""
 ⚠️ **Insufficient Strategic Units (SUs)**
@@ -89,8 +98,7 @@ Required for `{name}`: `{cost} SUs`
         # 4. Deduct cost on success (No-bullshit logic)
         if cost > 0:
             try:
-                db.update_token_balance(project_id, -cost)
-                db.log_activity(project_id, name, "execution", cost)
+                await asyncio.to_thread(_charge, db, project_id, name, cost)
             except InsufficientTokensError:
                 pass # Atomic check already passed, this is a safety fallback
                 
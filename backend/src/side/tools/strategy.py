@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 from pathlib import Path
 from side.llm.client import LLMClient
@@ -7,16 +8,39 @@ from side.intel.auto_intelligence import AutoIntelligence
 # In real prod, this is passed via args or env
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 
+# Built on first use and shared across calls: LLMClient loads .env and probes
+# providers, AutoIntelligence opens the memory store
+_intel: AutoIntelligence | None = None
+_llm: LLMClient | None = None
+
+
+def _get_intel() -> AutoIntelligence:
+    """Get or create the project's AutoIntelligence."""
+    global _intel
+    if _intel is None:
+        _intel = AutoIntelligence(PROJECT_ROOT)
+    return _intel
+
+
+def _get_llm() -> LLMClient:
+    """Get or create the shared LLM client."""
+    global _llm
+    if _llm is None:
+        _llm = LLMClient()
+    return _llm
+
+
 async def handle_decide(args: dict[str, Any]) -> str:
     """Handle architectural_decision tool."""
     question = args.get("question")
     base_context = args.get("context", "")
     
     # Auto-Inject Sovereign Context
-    intel = AutoIntelligence(PROJECT_ROOT)
-    sovereign_context = intel.gather_context(topic=question)
+    intel = _get_intel()
+    # File and memory reads run off the event loop
+    sovereign_context = await asyncio.to_thread(intel.gather_context, topic=question)
     
-    llm = LLMClient()
+    llm = _get_llm()
     prompt = f"Question: {question}\nUser Context: {base_context}\n\nProvide a strategic architectural decision."
     
     system_prompt = intel.enrich_system_prompt(
@@ -37,10 +61,10 @@ async def handle_strategy(args: dict[str, Any]) -> str:
     """Handle strategic_review tool."""
     base_context = args.get("context", "")
     
-    intel = AutoIntelligence(PROJECT_ROOT)
-    sovereign_context = intel.gather_context(topic=base_context)
+    intel = _get_intel()
+    sovereign_context = await asyncio.to_thread(intel.gather_context, topic=base_context)
     
-    llm = LLMClient()
+    llm = _get_llm()
     prompt = f"User Context: {base_context}\n\nConduct a strategic review of the current direction."
     
     system_prompt = intel.enrich_system_prompt(
@@ -3,6 +3,7 @@ Welcome tool handler - Day 1 Magic.
 
 Sets up Side and creates the Strategic Monolith for a new project.
 """
+import asyncio
 import os
 import logging
 from typing import Any
@@ -30,8 +31,12 @@ async def handle_welcome(arguments: dict[str, Any]) -> str:
     
     # Check if already initialized
     if is_side_initialized(project_path):
-        project_name = detect_project_name(Path(project_path))
-        stack = detect_stack(Path(project_path))
+        # Manifest reads are blocking; overlap them off the event loop
+        root = Path(project_path)
+        project_name, stack = await asyncio.gather(
+            asyncio.to_thread(detect_project_name, root),
+            asyncio.to_thread(detect_stack, root),
+        )
         
         # Ensure Monolith exists
         db = get_database()
@@ -33,7 +33,7 @@ async def call_tool_handler(server, name: str, arguments: dict[str, Any] | None,
     if len(arg_str) > MAX_ARG_SIZE:
         return [TextContent(type="text", text=f"❌ **Fuzzing Detected**: Payload size {len(arg_str)} exceeds limit.")]
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(f"🔧 [GOD MODE EXECUTING] {name}")
     
     try:
@@ -54,7 +54,7 @@ async def call_tool_handler(server, name: str, arguments: dict[str, Any] | None,
         except Exception as mem_err:
             logger.warning(f"Memory Intercept Failed: {mem_err}")
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         logger.info(f"✅ {name} SUCCESS ({elapsed:.3f}s)")
         
         return [TextContent(type="text", text=result)]
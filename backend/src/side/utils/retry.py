@@ -10,16 +10,96 @@ high-concurrency "Gardening" tasks.
 """
 
 import asyncio
+import json
 import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
 import httpx
 
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson parses response bytes directly and is markedly faster; stdlib json accepts bytes too
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Shared retry budget per upstream host: bursts of up to RETRY_BUDGET_TOKENS
+# retries, refilled at RETRY_BUDGET_REFILL_PER_SEC. Once spent, failures are
+# raised immediately instead of every caller piling its own retries onto a
+# host that is already struggling.
+RETRY_BUDGET_TOKENS = 10
+RETRY_BUDGET_REFILL_PER_SEC = 1.0
+
+
+class _TokenBucket:
+    """Minimal token bucket; only touched from the event loop thread."""
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_consume(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+_retry_budgets: dict[str, _TokenBucket] = {}
+
+
+def _retry_allowed(exc: httpx.HTTPError) -> bool:
+    """Spend one retry from the failing host's budget (errors without a request always retry)."""
+    try:
+        host = exc.request.url.host
+    except RuntimeError:  # exception raised without an attached request
+        return True
+    bucket = _retry_budgets.get(host)
+    if bucket is None:
+        bucket = _retry_budgets[host] = _TokenBucket(RETRY_BUDGET_TOKENS, RETRY_BUDGET_REFILL_PER_SEC)
+    return bucket.try_consume()
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait via Retry-After (delta or HTTP-date), if any."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -44,6 +124,11 @@ def retry_with_backoff(
                 return response.json()
     """
 
+    def backoff_delay(attempt: int) -> float:
+        # "Full jitter": a uniform draw below the exponential cap, so callers
+        # that failed together spread their retries instead of firing in lockstep
+        return random.uniform(0, min(base_delay * (exponential_base**attempt), max_delay))
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -66,26 +151,26 @@ def retry_with_backoff(
                         )
                         raise
 
-                    # Calculate delay with exponential backoff + jitter
-                    import random
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
-                    jitter = delay * 0.1 * random.uniform(-1, 1)
-                    actual_delay = max(0, delay + jitter)
+                    if not _retry_allowed(e):
+                        logger.error(f"{func.__name__} retry budget for host exhausted: {e}")
+                        raise
 
+                    delay = backoff_delay(attempt)
                     logger.warning(
                         f"{func.__name__} attempt {attempt + 1}/{max_retries} failed: {e}. "
-                        f"Retrying in {actual_delay:.1f}s (jittered)..."
+                        f"Retrying in {delay:.1f}s (jittered)..."
                     )
 
-                    await asyncio.sleep(actual_delay)
+                    await asyncio.sleep(delay)
 
                 except httpx.HTTPStatusError as e:
-                    # Don't retry on 4xx errors (client errors)
-                    if 400 <= e.response.status_code < 500:
+                    # Don't retry on 4xx errors (client errors), except 429 rate limiting
+                    status = e.response.status_code
+                    if 400 <= status < 500 and status != 429:
                         logger.error(f"{func.__name__} client error: {e}")
                         raise
 
-                    # Retry on 5xx errors (server errors)
+                    # Retry on 5xx errors (server errors) and 429
                     last_exception = e
 
                     if attempt == max_retries - 1:
@@ -94,7 +179,16 @@ def retry_with_backoff(
                         )
                         raise
 
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
+                    if not _retry_allowed(e):
+                        logger.error(f"{func.__name__} retry budget for host exhausted: {e}")
+                        raise
+
+                    delay = backoff_delay(attempt)
+                    # Retrying before the server's Retry-After would just be rejected again,
+                    # but never wait past max_delay inside the request path
+                    retry_after = _retry_after_seconds(e.response)
+                    if retry_after is not None:
+                        delay = min(max(delay, retry_after), max_delay)
                     logger.warning(
                         f"{func.__name__} server error (attempt {attempt + 1}/{max_retries}): {e}. "
                         f"Retrying in {delay:.1f}s..."
@@ -121,8 +215,8 @@ class ResilientHTTPClient:
     HTTP client with built-in retry logic and timeout handling.
 
     Usage:
-        client = ResilientHTTPClient()
-        data = await client.get_json("https://api.example.com/data")
+        async with ResilientHTTPClient() as client:
+            data = await client.get_json("https://api.example.com/data")
     """
 
     def __init__(
@@ -147,10 +241,35 @@ class ResilientHTTPClient:
             write=timeout,
             pool=timeout
         )
+        # One pooled client for every call, so repeat requests to a host reuse
+        # the TCP/TLS session instead of handshaking per request
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use (or after close)."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.smart_timeout,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return self._client
 
     async def close(self) -> None:
-        """Close the client (no-op since we use context managers)."""
-        pass
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # httpx spelling, so this can stand in wherever an AsyncClient is closed
+    aclose = close
+
+    async def __aenter__(self) -> "ResilientHTTPClient":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
     @retry_with_backoff(max_retries=3, base_delay=1.0)
     async def get_json(self, url: str, **kwargs: Any) -> Any:
@@ -167,10 +286,9 @@ class ResilientHTTPClient:
         Raises:
             httpx.HTTPError: On network or HTTP errors after retries
         """
-        async with httpx.AsyncClient(timeout=self.smart_timeout) as client:
-            response = await client.get(url, **kwargs)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().get(url, **kwargs)
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     @retry_with_backoff(max_retries=3, base_delay=1.0)
     async def get_text(self, url: str, **kwargs: Any) -> str:
@@ -187,10 +305,9 @@ class ResilientHTTPClient:
         Raises:
             httpx.HTTPError: On network or HTTP errors after retries
         """
-        async with httpx.AsyncClient(timeout=self.smart_timeout) as client:
-            response = await client.get(url, **kwargs)
-            response.raise_for_status()
-            return response.text
+        response = await self._get_client().get(url, **kwargs)
+        response.raise_for_status()
+        return response.text
 
     @retry_with_backoff(max_retries=3, base_delay=1.0)
     async def post_json(self, url: str, data: Any = None, **kwargs: Any) -> Any:
@@ -208,7 +325,6 @@ class ResilientHTTPClient:
         Raises:
             httpx.HTTPError: On network or HTTP errors after retries
         """
-        async with httpx.AsyncClient(timeout=self.smart_timeout) as client:
-            response = await client.post(url, json=data, **kwargs)
-            response.raise_for_status()
-            return response.json()
+        response = await self._get_client().post(url, json=data, **kwargs)
+        response.raise_for_status()
+        return _json_loads(response.content)
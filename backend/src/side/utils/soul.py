@@ -5,9 +5,36 @@ Transforms generic audit results into conversational, high-fidelity findings
 and machine-optimized actionable prompts.
 """
 
+import re
 from typing import Any, List
 from pathlib import Path
 
+# Sanitizers are applied per finding; compile them once at import.
+_LEADING_NONE_RE = re.compile(r"^none\.\s*", re.IGNORECASE)
+_IMPLEMENT_PROTOCOL_RE = re.compile(r"Implement '(.*?)' protocol")
+_DISCOVERY_HEADER_RE = re.compile(r"(Side Intelligence|Forensic|Logic|Structural|Critical|Security)\s*(anomaly|risk|breach|rot|intelligence|Opportunity)\s*(found|detected|refinement|signals)\s*(in|at|detected|within)\s*.*?(:\d+)?\.\s*", re.IGNORECASE)
+_SCANNED_HEADER_RE = re.compile(r"Scanned \d+ .*? files with Side Intelligence\.\s*", re.IGNORECASE)
+# Known fluff impact phrases (global search & destroy), folded into one alternation
+_FLUFF_RE = re.compile("|".join([
+    r"This creates structural friction and impacts the project's strategic IQ\.?",
+    r"This creates technical friction and impacts the project's strategic IQ\.?",
+    r"This creates structural friction and impacts the project's overall reliability\.?",
+    r"This increases the attack surface and compromises overall system sovereignty\.?",
+    r"This increases the attack surface and compromises data integrity\.?",
+    r"This leads to resource exhaustion and degrades the system's operational efficiency\.?",
+    r"This introduces technical debt and reduces the long-term maintainability of the codebase\.?",
+    r"This introduces unpredictable state transitions and degrades system reliability\.?",
+    r"This violates structural constraints and complicates future system scaling\.?",
+    r"This creates technical friction and impacts the project's overall reliability\.?",
+    r"This degrades system consistency and impacts long-term reliability\.?",
+    r"Unhandled edge cases degrade the system's reliability and increase long-term technical debt\.?",
+    r"Sovereignty breach detected in.*?\.\s*",
+    r"Strategic risk detected in.*?\.\s*",
+    r"Found \d+ endpoints, \d+ with visible auth\.?",
+]), re.IGNORECASE)
+_PY_PATH_PREFIX_RE = re.compile(r"^[^\s]*\.py(:\d+)?\.?\s*")
+_DOUBLE_DOT_RE = re.compile(r"\.\s*\.")
+
 class StrategicSoul:
     """Utility to inject 'Soul' and density into forensic findings."""
 
@@ -17,8 +44,7 @@ class StrategicSoul:
         msg = result.notes if hasattr(result, 'notes') and result.notes and str(result.notes).lower() != "none" else ""
         
         # Aggressive Sanitization: Remove "None. " and duplicates
-        import re
-        msg = re.sub(r"^none\.\s*", "", str(msg), flags=re.IGNORECASE)
+        msg = _LEADING_NONE_RE.sub("", str(msg))
         
         # If notes were just the check name or redundant, return empty
         if msg.lower() == result.check_name.lower():
@@ -141,8 +167,7 @@ class StrategicSoul:
         # Recommendation Polish: ensure we don't 'Implement Implement'
         recommendation = f_dict.get('action', 'Review/Refactor')
         if recommendation.startswith("Implement '"):
-             import re
-             match = re.search(r"Implement '(.*?)' protocol", recommendation)
+             match = _IMPLEMENT_PROTOCOL_RE.search(recommendation)
              if match:
                  recommendation = match.group(1)
 
@@ -153,7 +178,6 @@ class StrategicSoul:
              raw_discovery = msg.split("\n\n")[0] if "\n\n" in msg else msg
              
              # Multiline strip of known legacy headers/prefixes
-             import re
              # 1. Strip Empathy & dimension headers globally
              notes = raw_discovery.replace("Hey Side!", "").replace("Hey Chat!", "").strip()
              empathy_fluff = [
@@ -171,34 +195,16 @@ class StrategicSoul:
              
              # 2. Strip Discovery headers globally (Anomaly found in...)
              # Aggressive block-level stripping
-             notes = re.sub(r"(Side Intelligence|Forensic|Logic|Structural|Critical|Security)\s*(anomaly|risk|breach|rot|intelligence|Opportunity)\s*(found|detected|refinement|signals)\s*(in|at|detected|within)\s*.*?(:\d+)?\.\s*", "", notes, flags=re.IGNORECASE)
-             notes = re.sub(r"Scanned \d+ .*? files with Side Intelligence\.\s*", "", notes, flags=re.IGNORECASE)
+             notes = _DISCOVERY_HEADER_RE.sub("", notes)
+             notes = _SCANNED_HEADER_RE.sub("", notes)
 
              # 3. Strip all known fluff impact phrases (Global search & destroy)
-             fluff_patterns = [
-                 r"This creates structural friction and impacts the project's strategic IQ\.?",
-                 r"This creates technical friction and impacts the project's strategic IQ\.?",
-                 r"This creates structural friction and impacts the project's overall reliability\.?",
-                 r"This increases the attack surface and compromises overall system sovereignty\.?",
-                 r"This increases the attack surface and compromises data integrity\.?",
-                 r"This leads to resource exhaustion and degrades the system's operational efficiency\.?",
-                 r"This introduces technical debt and reduces the long-term maintainability of the codebase\.?",
-                 r"This introduces unpredictable state transitions and degrades system reliability\.?",
-                 r"This violates structural constraints and complicates future system scaling\.?",
-                 r"This creates technical friction and impacts the project's overall reliability\.?",
-                 r"This degrades system consistency and impacts long-term reliability\.?",
-                 r"Unhandled edge cases degrade the system's reliability and increase long-term technical debt\.?",
-                 r"Sovereignty breach detected in.*?\.\s*",
-                 r"Strategic risk detected in.*?\.\s*",
-                 r"Found \d+ endpoints, \d+ with visible auth\.?"
-             ]
-             for p in fluff_patterns:
-                  notes = re.sub(p, "", notes, flags=re.IGNORECASE)
+             notes = _FLUFF_RE.sub("", notes)
              
              # 4. Final path/line strip for any remaining artifacts
-             notes = re.sub(r"^[^\s]*\.py(:\d+)?\.?\s*", "", notes.strip())
+             notes = _PY_PATH_PREFIX_RE.sub("", notes.strip())
              # Clean up multiple dots and whitespace
-             notes = re.sub(r"\.\s*\.", ".", notes)
+             notes = _DOUBLE_DOT_RE.sub(".", notes)
              notes = notes.replace("..", ".").strip(". ")
         
         if not notes and msg and not msg.startswith("Hey Side!"):
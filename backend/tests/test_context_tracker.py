@@ -0,0 +1,47 @@
+"""
+Tests for context tracker.
+"""
+
+import pytest
+
+from side.llm import client as llm_client
+from side.services.context_tracker import ContextTracker
+from side.storage.simple_db import SimplifiedDatabase
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    """Tracker whose LLM call always fails, so the heuristic fallback runs."""
+
+    class OfflineLLM:
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("offline")
+
+    monkeypatch.setattr(llm_client, "LLMClient", OfflineLLM)
+    return ContextTracker(SimplifiedDatabase(tmp_path / "test.db"))
+
+
+class TestFocusFallback:
+    """Tests for the non-LLM focus heuristic."""
+
+    @pytest.mark.asyncio
+    async def test_auth_substring_inside_word(self, tracker):
+        """Test 'auth' counts anywhere in a name, e.g. oauth."""
+        result = await tracker._detect_focus_area(
+            ["src/oauth_callback.py"], [{"message": "review city uint layout"}]
+        )
+        assert result == ("Authentication", 0.4)
+
+    @pytest.mark.asyncio
+    async def test_test_substring(self, tracker):
+        """Test 'test' maps to Testing when no auth hint is present."""
+        result = await tracker._detect_focus_area(["pytest.ini"], [])
+        assert result == ("Testing", 0.4)
+
+    @pytest.mark.asyncio
+    async def test_no_match_is_general(self, tracker):
+        """Test other keywords (ui, ci, cd, view) don't classify on their own."""
+        result = await tracker._detect_focus_area(
+            ["src/view/ui.py"], [{"message": "cdn city config"}]
+        )
+        assert result == ("General Development", 0.3)
@@ -0,0 +1,42 @@
+"""
+Tests for .env loading.
+"""
+
+import os
+
+from side.env import ENV_LOADED_FLAG, _parse_env, load_env_file
+
+
+class TestParseEnv:
+    """Tests for the .env parser."""
+
+    def test_parses_assignments(self):
+        """Test keys and values are trimmed and quotes stripped."""
+        text = "A=1\n  B = 'two words'  \nC=\"q\"\nD=a=b\n"
+
+        assert _parse_env(text) == {"A": "1", "B": "two words", "C": "q", "D": "a=b"}
+
+    def test_skips_comments_blanks_and_empty_values(self):
+        """Test comment lines, bare keys and empty values are ignored."""
+        text = "# A=1\n\n=orphan\nB=\nC=3\n"
+
+        assert _parse_env(text) == {"C": "3"}
+
+    def test_first_assignment_wins(self):
+        """Test a repeated key keeps its first value."""
+        assert _parse_env("A=1\r\nA=2\r\n") == {"A": "1"}
+
+
+class TestLoadEnvFile:
+    """Tests for load_env_file."""
+
+    def test_skips_when_already_loaded(self, tmp_path, monkeypatch):
+        """Test the loaded flag short-circuits before any .env is read."""
+        (tmp_path / ".env").write_text("SIDE_TEST_ONLY_VAR=1\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(ENV_LOADED_FLAG, "1")
+        monkeypatch.delenv("SIDE_TEST_ONLY_VAR", raising=False)
+
+        load_env_file()
+
+        assert "SIDE_TEST_ONLY_VAR" not in os.environ
@@ -2,10 +2,15 @@
 Tests for query cache integration in tools.
 """
 
+import os
+import time
+
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from side.storage.modules.base import epoch_us
 from side.storage.simple_db import SimplifiedDatabase
 
 
@@ -81,6 +86,76 @@ class TestQueryCache:
         cached = db.get_query_cache("read", {})
         assert cached is None
 
+    def test_memoized_hits_return_independent_copies(self, db):
+        """Test repeated hits are served in-process without sharing mutable results."""
+        db.save_query_cache("read", {}, {"items": [1]})
+
+        first = db.get_query_cache("read", {})
+        first["items"].append(2)
+
+        assert db.get_query_cache("read", {}) == {"items": [1]}
+
+    def test_memo_evicts_least_recently_used(self, db, monkeypatch):
+        """Test a recent hit keeps an entry memoized when the memo overflows."""
+        monkeypatch.setattr(db.operational, "MEMO_MAX_ENTRIES", 2)
+        db.save_query_cache("read", {"n": 1}, {"n": 1})
+        db.save_query_cache("read", {"n": 2}, {"n": 2})
+        db.get_query_cache("read", {"n": 1})
+        db.save_query_cache("read", {"n": 3}, {"n": 3})
+
+        memo = db.operational._memo
+        assert db.compute_cache_key("read", {"n": 1}) in memo
+        assert db.compute_cache_key("read", {"n": 2}) not in memo
+
+    def test_precomputed_key_matches_params_lookup(self, db):
+        """Test the *_by_key methods address the same rows as the params-based ones."""
+        key = db.compute_cache_key("read", {"refresh": False})
+        db.save_query_cache_by_key(key, "read", {"data": "k"})
+        db.operational._memo.clear()
+
+        assert db.get_query_cache("read", {"refresh": False}) == {"data": "k"}
+        assert db.get_query_cache_by_key(key) == {"data": "k"}
+        assert db.invalidate_query_cache("read") == 1
+
+    def test_memo_survives_concurrent_access(self, db, monkeypatch):
+        """Test worker threads can read, fill and invalidate the memo at the same time."""
+        monkeypatch.setattr(db.operational, "MEMO_MAX_ENTRIES", 8)
+        expires_us = epoch_us() + 60_000_000
+        store = db.operational
+
+        def churn(worker):
+            for i in range(300):
+                key = store.compute_cache_key("read", {"n": i % 16})
+                store._remember(key, "read", f'{{"n":{i}}}', expires_us, store._memo_generation)
+                store.get_query_cache("read", {"n": (i + worker) % 16})
+                if i % 50 == worker:
+                    store.invalidate_query_cache("read")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(churn, w) for w in range(4)]:
+                future.result()
+
+        assert len(store._memo) <= 8
+
+    def test_invalidate_during_read_is_not_re_memoized(self, db, monkeypatch):
+        """Test a read that fetched the row before an invalidation can't memoize it afterwards."""
+        from side.storage.modules import transient
+
+        db.save_query_cache("read", {}, {"data": "stale"})
+        db.operational._memo.clear()
+        real_unpack = transient.unpack_json
+
+        def invalidate_mid_read(value):
+            # Runs between the reader's SELECT and its _remember
+            db.invalidate_query_cache("read")
+            return real_unpack(value)
+
+        monkeypatch.setattr(transient, "unpack_json", invalidate_mid_read)
+        assert db.get_query_cache("read", {}) == {"data": "stale"}
+        monkeypatch.setattr(transient, "unpack_json", real_unpack)
+
+        assert db.get_query_cache("read", {}) is None
+
     def test_invalidate_query_cache(self, db):
         """Test cache invalidation."""
         db.save_query_cache("read", {}, {"data": "1"})
@@ -141,7 +216,7 @@ class TestWorkContext:
         import sqlite3
         import json
 
-        expires_at = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        expires_at = epoch_us(datetime.now(timezone.utc) - timedelta(days=1))
 
         with sqlite3.connect(db.db_path) as conn:
             conn.execute(
@@ -177,7 +252,7 @@ class TestAutoCleanup:
         import json
 
         # Add expired work context
-        expires_at = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        expires_at = epoch_us(datetime.now(timezone.utc) - timedelta(days=1))
         with sqlite3.connect(db.db_path) as conn:
             conn.execute(
                 """
@@ -208,6 +283,70 @@ class TestAutoCleanup:
         assert deleted["work_context"] >= 1
         assert deleted["query_cache"] >= 1
 
+    def test_insert_sweeps_older_expired_rows(self, db):
+        """Test the TTL trigger drops expired cache rows when a new one is inserted."""
+        db.save_query_cache("stale", {}, {"data": "old"}, ttl_hours=-1)
+        db.save_query_cache("fresh", {}, {"data": "new"})
+
+        with db._connection() as conn:
+            types = [row["query_type"] for row in conn.execute("SELECT query_type FROM query_cache")]
+
+        assert types == ["fresh"]
+
+    def test_migrates_iso_expiry_to_epoch(self, db):
+        """Test legacy ISO-8601 expires_at values are converted on open."""
+        import sqlite3
+        from datetime import timedelta
+
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute(
+                "INSERT INTO query_cache (query_hash, query_type, result, expires_at) VALUES (?, ?, ?, ?)",
+                ("legacy", "read", "{}", expires.isoformat()),
+            )
+            conn.execute("UPDATE meta SET value = '1.0' WHERE key = 'version'")
+            conn.commit()
+
+        reopened = SimplifiedDatabase(db.db_path)
+
+        with reopened._connection() as conn:
+            row = conn.execute("SELECT expires_at FROM query_cache WHERE query_hash = 'legacy'").fetchone()
+        assert isinstance(row["expires_at"], int)
+        assert abs(row["expires_at"] - epoch_us(expires)) < 1000
+        assert reopened.operational.get_version() == 1.2
+
+    def test_cleanup_returns_freed_pages(self, db):
+        """Test cleanup's incremental vacuum actually shrinks the freelist."""
+        for i in range(200):
+            db.save_query_cache("bulk", {"n": i}, {"blob": os.urandom(2000).hex()})
+        with db._connection() as conn:
+            conn.execute("UPDATE query_cache SET expires_at = 0")
+            conn.execute("DELETE FROM query_cache")
+            freed = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        assert freed > 1
+
+        # Skip the hourly ANALYZE, whose stats table would reuse free pages itself
+        db._last_analyze = time.monotonic()
+        db.cleanup_expired_data()
+
+        with db._connection() as conn:
+            # Fewer than 512 pages were freed, so one cleanup returns all of them
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_migrates_legacy_file_to_incremental_vacuum(self, tmp_path):
+        """Test a file created without auto_vacuum is converted on open."""
+        import sqlite3
+
+        path = tmp_path / "legacy.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE legacy (x)")
+        assert sqlite3.connect(path).execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+        migrated = SimplifiedDatabase(path)
+
+        with migrated._connection() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
     def test_get_database_stats(self, db):
         """Test database statistics."""
         # Add some data
@@ -0,0 +1,42 @@
+"""
+Tests for retry backoff.
+"""
+
+import httpx
+import pytest
+from unittest import mock
+
+from side.utils import retry
+
+
+def _failing(status: int, headers: dict[str, str]):
+    """A decorated call that always fails with the given status and headers."""
+
+    @retry.retry_with_backoff(max_retries=2, base_delay=1.0, max_delay=10.0)
+    async def call():
+        request = httpx.Request("GET", f"https://retry-{status}.example/")
+        httpx.Response(status, headers=headers, request=request).raise_for_status()
+
+    return call
+
+
+class TestRetryAfter:
+    """Tests for Retry-After handling."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured(self):
+        """Test a short Retry-After raises the wait above the jittered backoff."""
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()) as sleep:
+            with pytest.raises(httpx.HTTPStatusError):
+                await _failing(429, {"Retry-After": "7"})()
+
+        assert sleep.await_args.args[0] == 7.0
+
+    @pytest.mark.asyncio
+    async def test_large_retry_after_is_capped_at_max_delay(self):
+        """Test an hour-long Retry-After never sleeps past max_delay."""
+        with mock.patch("asyncio.sleep", new=mock.AsyncMock()) as sleep:
+            with pytest.raises(httpx.HTTPStatusError):
+                await _failing(503, {"Retry-After": "3600"})()
+
+        assert sleep.await_args.args[0] == 10.0
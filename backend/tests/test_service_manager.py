@@ -0,0 +1,117 @@
+"""
+Tests for service manager health reporting.
+"""
+
+import asyncio
+
+import pytest
+
+from side.services.service_manager import ServiceManager
+
+
+class FlaggedService:
+    """Service with no task, only a _running flag."""
+
+    _running = True
+
+
+class TestHealth:
+    """Tests for combined task-exit and flag-based health."""
+
+    @pytest.mark.asyncio
+    async def test_stopped_flag_and_exited_task_are_unhealthy(self, tmp_path):
+        """Test a live service with _running=False, and a finished task, both report unhealthy."""
+        manager = ServiceManager(tmp_path)
+        manager._running = True
+        watcher = FlaggedService()
+        task = asyncio.create_task(asyncio.sleep(0))
+        for name, service in (("watcher", watcher), ("sync", task)):
+            manager._services[name] = service
+            manager._status["services"][name] = {}
+            manager._watch_health(name, service)
+        await task
+
+        monitor = asyncio.create_task(manager._health_monitor())
+        await asyncio.sleep(0.01)
+        assert manager._status["services"]["watcher"]["healthy"] is True
+        assert manager._status["services"]["sync"]["healthy"] is False
+
+        watcher._running = False
+        manager.report_health("watcher")
+        await asyncio.sleep(0.01)
+        assert manager._status["services"]["watcher"]["healthy"] is False
+
+        manager._running = False
+        monitor.cancel()
+
+
+class StoppableService:
+    """Service that records whether stop() was called."""
+
+    stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+class TestStartup:
+    """Tests for concurrent startup failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_failed_start_stops_services_that_started(self, tmp_path):
+        """Test one failing service re-raises its own error and stops the others."""
+        manager = ServiceManager(tmp_path)
+        started = StoppableService()
+
+        async def start_ok():
+            await asyncio.sleep(0.01)
+            manager._services["ok"] = started
+            manager._status["services"]["ok"] = {"status": "running"}
+
+        async def start_fail():
+            raise ValueError("boom")
+
+        async def start_noop():
+            pass
+
+        manager._start_file_watcher = start_ok
+        manager._start_context_tracker = start_fail
+        manager._start_cleanup_scheduler = start_noop
+        manager._start_supabase_sync = start_noop
+        manager._start_telemetry = start_noop
+
+        with pytest.raises(ValueError, match="boom"):
+            await manager.start()
+
+        assert started.stopped is True
+        assert manager._status["services"]["ok"]["status"] == "stopped"
+        assert manager._running is False
+
+
+class TestFileChangeFlush:
+    """Tests for debounced file-change processing during shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_flush(self, tmp_path):
+        """Test stop() lets a running batch finish before stopping services."""
+        manager = ServiceManager(tmp_path)
+        manager._running = True
+        service = StoppableService()
+        manager._services["svc"] = service
+        manager._status["services"]["svc"] = {}
+        events = []
+
+        async def process(files):
+            await asyncio.sleep(0.02)
+            events.append(("processed", service.stopped))
+
+        manager._process_file_changes = process
+        manager._pending_files = {tmp_path / "a.py"}
+        # No debounce delay, so the batch is mid-processing when stop() runs
+        manager._pending_update = asyncio.create_task(manager._flush_file_changes(delay=0))
+        await asyncio.sleep(0.005)
+
+        await manager.stop()
+
+        assert events == [("processed", False)]
+        assert service.stopped is True
@@ -58,3 +58,60 @@ class TestSimplifiedDatabase:
         db.update_profile("test", {"name": "Test Profile"})
 
         assert db.get_profile_count() == 1
+
+    def test_get_overdue_goals(self, db):
+        """Test only unfinished goals with a past due date are overdue."""
+        db.save_goal("late", "Late", due_date="2000-01-01")
+        db.save_goal("future", "Future", due_date="2999-01-01")
+        db.save_goal("undated", "Undated")
+        db.save_goal("shipped", "Shipped", due_date="2000-01-01")
+        db.update_goal_status("shipped", "done")
+
+        assert [g["id"] for g in db.get_overdue_goals()] == ["late"]
+
+    def test_large_work_context_round_trips_compressed(self, db):
+        """Test large JSON columns are stored as compressed BLOBs and read back intact."""
+        commits = [{"hash": f"{i:08x}", "message": "m" * 80} for i in range(5)]
+        db.save_work_context("/proj", "Testing", ["a.py"], commits)
+
+        with db.engine.connection() as conn:
+            row = conn.execute(
+                "SELECT typeof(recent_files), typeof(recent_commits) FROM work_context"
+            ).fetchone()
+        assert tuple(row) == ("text", "blob")
+        assert db.get_latest_work_context("/proj")["recent_commits"] == commits
+
+
+class TestConnectionReuse:
+    """Tests for the engine's per-thread connection."""
+
+    def test_connection_is_reused(self, db):
+        """Test consecutive blocks on one thread share a connection."""
+        with db.engine.connection() as first:
+            pass
+        with db.engine.connection() as second:
+            pass
+
+        assert first is second
+
+    def test_nested_failure_rolls_back_outer_block(self, db):
+        """Test only the outermost block commits, so a nested error discards both writes."""
+        with pytest.raises(RuntimeError):
+            with db.engine.connection() as conn:
+                conn.execute("INSERT INTO meta (key, value) VALUES ('outer', '1')")
+                with db.engine.connection() as inner:
+                    inner.execute("INSERT INTO meta (key, value) VALUES ('inner', '1')")
+                    raise RuntimeError("boom")
+
+        assert db.get_setting("outer") is None
+        assert db.get_setting("inner") is None
+
+    def test_close_reopens_on_next_use(self, db):
+        """Test close() drops the connection and the next block opens a new one."""
+        with db.engine.connection() as first:
+            pass
+        db.engine.close()
+        with db.engine.connection() as second:
+            assert second.execute("SELECT 1").fetchone()[0] == 1
+
+        assert first is not second